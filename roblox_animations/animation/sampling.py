@@ -0,0 +1,209 @@
+"""
+Direct pose sampling from action F-Curves.
+
+Evaluates bone channels with fcurve.evaluate and runs a vectorized FK pass,
+so callers can read armature-space pose matrices for many frames without
+scene.frame_set and the full depsgraph re-evaluation it triggers.
+"""
+
+import re
+from typing import Optional, Sequence, Tuple
+
+from ..core.utils import get_action_fcurves
+
+
+BONE_FCURVE_RE = re.compile(r'pose\.bones\["(.+?)"\]')
+
+_SAMPLED_CHANNELS = ("location", "rotation_quaternion", "rotation_euler", "scale")
+
+
+def can_sample_action_directly(armature_obj: "bpy.types.Object", action, fcurves) -> bool:
+    """True when the pose is fully determined by the action's bone channels.
+
+    Anything the depsgraph would add on top (drivers, constraints, NLA
+    blending or tweak mode, non-HOLD action extrapolation, a slot other than
+    the one the fcurves came from, object animation or parenting, the
+    armature shown in Rest Position, non-default bone inheritance) forces
+    the frame_set path.
+    """
+    anim = armature_obj.animation_data
+    if anim is None or anim.action != action or len(anim.drivers):
+        return False
+    if getattr(anim, "use_tweak_mode", False):
+        return False
+    if any(not track.mute for track in anim.nla_tracks):
+        return False
+    if getattr(anim, "action_extrapolation", "HOLD") != "HOLD":
+        # HOLD_FORWARD/NOTHING drop the action outside its keyed range,
+        # fcurve.evaluate would still extrapolate
+        return False
+    slots = getattr(action, "slots", None)
+    if slots is not None and len(slots):
+        # layered actions: get_action_fcurves picks a slot on its own, so only
+        # trust it when there is a single slot and the armature is bound to it
+        if len(slots) > 1 or getattr(anim, "action_slot", None) != slots[0]:
+            return False
+    if getattr(anim, "action_influence", 1.0) != 1.0:
+        return False
+    if getattr(anim, "action_blend_type", "REPLACE") != "REPLACE":
+        return False
+    data_anim = armature_obj.data.animation_data
+    if data_anim is not None and (data_anim.action or len(data_anim.drivers)):
+        return False
+    if armature_obj.parent is not None or len(armature_obj.constraints):
+        return False
+    if armature_obj.data.pose_position != "POSE":
+        # Rest Position: the evaluated pose ignores the action entirely
+        return False
+
+    for pbone in armature_obj.pose.bones:
+        bone = pbone.bone
+        if (
+            len(pbone.constraints)
+            or pbone.rotation_mode == "AXIS_ANGLE"
+            or not bone.use_inherit_rotation
+            or bone.inherit_scale != "FULL"
+            or not bone.use_local_location
+        ):
+            return False
+
+    for fcurve in fcurves:
+        if not fcurve.mute and not fcurve.data_path.startswith("pose.bones"):
+            # object-level animation moves matrix_world
+            return False
+    return True
+
+
+def euler_to_matrices(eulers: "np.ndarray", order: str) -> "np.ndarray":
+    """(F, 3) euler angles -> (F, 3, 3) rotation matrices for a Blender rotation order."""
+    import numpy as np
+
+    count = len(eulers)
+    axis_mats = {}
+    for axis, (i, j) in zip("XYZ", ((1, 2), (2, 0), (0, 1))):
+        angle = eulers[:, "XYZ".index(axis)]
+        c, s = np.cos(angle), np.sin(angle)
+        m = np.zeros((count, 3, 3))
+        m[:, "XYZ".index(axis), "XYZ".index(axis)] = 1.0
+        m[:, i, i] = c
+        m[:, j, j] = c
+        m[:, i, j] = -s
+        m[:, j, i] = s
+        axis_mats[axis] = m
+    # the first axis in the order is applied first
+    return axis_mats[order[2]] @ axis_mats[order[1]] @ axis_mats[order[0]]
+
+
+def quats_to_matrices(quats: "np.ndarray") -> "np.ndarray":
+    """(F, 4) quaternions (w, x, y, z) -> (F, 3, 3) rotation matrices, normalizing like Blender."""
+    import numpy as np
+
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    unit = np.where(norms > 0.0, quats / np.where(norms > 0.0, norms, 1.0), (1.0, 0.0, 0.0, 0.0))
+    w, x, y, z = unit.T
+    return np.stack(
+        (
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=1),
+            np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=1),
+            np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=1),
+        ),
+        axis=1,
+    )
+
+
+def sample_pose_matrices(
+    armature_obj: "bpy.types.Object",
+    action,
+    frames: Sequence[int],
+) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+    """Evaluate pose matrices for *frames* straight from the action's F-Curves.
+
+    Args:
+        armature_obj: The armature object the action drives.
+        action: The action to sample.
+        frames: Frame numbers to evaluate.
+
+    Returns:
+        None when the rig needs the depsgraph (see can_sample_action_directly),
+        otherwise (pose_mats (F, B, 4, 4), quats (F, B, 4)) in pose.bones
+        order. pose_mats are armature space, like PoseBone.matrix.
+    """
+    import numpy as np
+
+    fcurves = get_action_fcurves(action)
+    if not can_sample_action_directly(armature_obj, action, fcurves):
+        return None
+
+    pose_bones = list(armature_obj.pose.bones)
+    index = {pb.name: i for i, pb in enumerate(pose_bones)}
+    count = len(frames)
+
+    # channels without an fcurve hold their current value on every frame
+    channels = {
+        "location": np.array([tuple(pb.location) for pb in pose_bones], dtype=np.float64),
+        "rotation_quaternion": np.array(
+            [tuple(pb.rotation_quaternion) for pb in pose_bones], dtype=np.float64
+        ),
+        "rotation_euler": np.array([tuple(pb.rotation_euler) for pb in pose_bones], dtype=np.float64),
+        "scale": np.array([tuple(pb.scale) for pb in pose_bones], dtype=np.float64),
+    }
+    channels = {
+        key: np.repeat(value.reshape(1, len(pose_bones), -1), count, axis=0)
+        for key, value in channels.items()
+    }
+
+    for fcurve in fcurves:
+        if fcurve.mute:
+            continue
+        data_path = fcurve.data_path
+        m = BONE_FCURVE_RE.match(data_path)
+        if not m:
+            continue
+        prop = data_path[m.end():].lstrip(".")
+        if prop not in _SAMPLED_CHANNELS:
+            continue
+        bone_index = index.get(m.group(1))
+        if bone_index is None:
+            # escaped or stale bone name; let the depsgraph sort it out
+            return None
+        channels[prop][:, bone_index, fcurve.array_index] = [
+            fcurve.evaluate(f) for f in frames
+        ]
+
+    # location on connected bones is not something we want to second-guess
+    connected = np.array([pb.bone.use_connect for pb in pose_bones], dtype=bool)
+    if connected.any() and np.any(channels["location"][:, connected] != 0.0):
+        return None
+
+    # local basis per bone: T(location) @ R(rotation) @ S(scale)
+    basis = np.zeros((count, len(pose_bones), 4, 4))
+    basis[:, :, 3, 3] = 1.0
+    basis[:, :, :3, 3] = channels["location"]
+    for i, pb in enumerate(pose_bones):
+        if pb.rotation_mode == "QUATERNION":
+            rot = quats_to_matrices(channels["rotation_quaternion"][:, i])
+        else:
+            rot = euler_to_matrices(channels["rotation_euler"][:, i], pb.rotation_mode)
+        basis[:, i, :3, :3] = rot * channels["scale"][:, i, None, :]
+
+    # rest offsets relative to the parent, then FK from the roots down
+    rest = np.array([np.array(pb.bone.matrix_local) for pb in pose_bones], dtype=np.float64)
+    parents = [index[pb.parent.name] if pb.parent else -1 for pb in pose_bones]
+
+    def depth(i):
+        d = 0
+        while parents[i] >= 0:
+            i = parents[i]
+            d += 1
+        return d
+
+    pose_mats = np.empty_like(basis)
+    for i in sorted(range(len(pose_bones)), key=depth):
+        parent = parents[i]
+        if parent < 0:
+            pose_mats[:, i] = rest[i] @ basis[:, i]
+        else:
+            offset = np.linalg.inv(rest[parent]) @ rest[i]
+            pose_mats[:, i] = pose_mats[:, parent] @ offset @ basis[:, i]
+
+    return pose_mats, channels["rotation_quaternion"]
@@ -5,6 +5,7 @@ Utility functions for the Roblox Animations Blender Addon.
 import bpy
 import hashlib
 import time
+from operator import attrgetter
 from mathutils import Matrix, Vector
 from .constants import (
     get_blender_version,
@@ -20,9 +21,16 @@ _armature_cache_timestamp = 0
 _action_hash_cache = {}
 _action_hash_cache_timestamp = 0
 
+# object name -> name of its 'RIG: ' master collection
+_master_collection_cache = {}
+
 # Animation tracking globals
 armature_anim_hashes = {}
 
+# Resolved on first use; selection moved from Bone to PoseBone in newer Blender
+_pose_bone_select_getter = None
+_bone_has_hide = None
+
 
 def get_animation_data_action_slot(animation_data, action=None):
     """Return the action slot currently bound on an ID's animation data.
@@ -109,6 +117,24 @@ def pose_bone_selected(pose_bone):
     return False
 
 
+def pose_bone_select_getter():
+    """Return a callable reading a pose bone's selection state.
+
+    The attribute location only depends on the Blender version, so it is
+    probed once and returned as an attrgetter (C-level, no Python frame per
+    bone). Falls back to pose_bone_selected when neither RNA property exists.
+    """
+    global _pose_bone_select_getter
+    if _pose_bone_select_getter is None:
+        if "select" in bpy.types.PoseBone.bl_rna.properties:
+            _pose_bone_select_getter = attrgetter("select")
+        elif "select" in bpy.types.Bone.bl_rna.properties:
+            _pose_bone_select_getter = attrgetter("bone.select")
+        else:
+            _pose_bone_select_getter = pose_bone_selected
+    return _pose_bone_select_getter
+
+
 def pose_bone_set_selected(pose_bone, value):
     """Compatibility helper to set pose bone selection state."""
     if pose_bone is None:
@@ -135,13 +161,18 @@ def pose_bone_set_selected(pose_bone, value):
 
 def pose_bone_set_hidden(pose_bone, value):
     """Compatibility helper to set pose bone visibility state."""
+    global _bone_has_hide
     if pose_bone is None:
         return
 
-    bone = getattr(pose_bone, "bone", None)
+    # where `hide` lives depends on the Blender version, not the bone
+    if _bone_has_hide is None:
+        _bone_has_hide = "hide" in bpy.types.Bone.bl_rna.properties
+
     hidden = bool(value)
+    bone = pose_bone.bone if _bone_has_hide else None
 
-    if bone is not None and hasattr(bone, "hide"):
+    if bone is not None:
         bone.hide = hidden
         return
 
@@ -570,10 +601,20 @@ def iter_scene_objects(scene=None):
 
 def find_master_collection_for_object(obj):
     """Find the top-level 'RIG: ' collection for a given object."""
+    obj_name = obj.name
+    # Names rather than collection references, so undo can't leave a
+    # dangling pointer; the hit is re-validated before use
+    cached_name = _master_collection_cache.get(obj_name)
+    if cached_name is not None:
+        coll = bpy.data.collections.get(cached_name)
+        if coll is not None and obj_name in coll.all_objects:
+            return coll
+        del _master_collection_cache[obj_name]
+
     for coll in bpy.data.collections:
-        if coll.name.startswith("RIG: ") and obj.name in [
-            o.name for o in coll.all_objects
-        ]:
+        # name lookup on all_objects runs in C, no per-object list
+        if coll.name.startswith("RIG: ") and obj_name in coll.all_objects:
+            _master_collection_cache[obj_name] = coll.name
             return coll
     return None
 
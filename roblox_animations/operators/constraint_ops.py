@@ -109,10 +109,14 @@ class OBJECT_OT_ManualConstraint(bpy.types.Operator):
 
         # Create a reverse map of currently constrained objects {object_name: bone_name}
         constrained_map = {}
+        armature_ptr = armature.as_pointer()
         for obj in parts_collection.objects:
             if obj.type == "MESH":
                 for c in obj.constraints:
-                    if c.type == "CHILD_OF" and c.target == armature:
+                    if c.type != "CHILD_OF":
+                        continue
+                    target = c.target
+                    if target is not None and target.as_pointer() == armature_ptr:
                         constrained_map[obj.name] = c.subtarget
                         break
 
@@ -183,20 +187,26 @@ class OBJECT_OT_ManualConstraint(bpy.types.Operator):
                     new_assignments[mesh_obj] = bone_item.name
 
         # 2. Update constraints for all objects within this rig's parts collection
+        armature_ptr = armature.as_pointer()
         for obj in parts_collection.objects:
             if obj.type != "MESH":
                 continue
 
             # First, remove any existing CHILD_OF constraint that targets this armature
-            # use list() to iterate over a copy, preventing skipped items during removal
-            for c in list(obj.constraints):
-                if c.type == "CHILD_OF" and c.target == armature:
-                    obj.constraints.remove(c)
+            # walk backwards so removal never skips items, without copying the list
+            constraints = obj.constraints
+            for i in range(len(constraints) - 1, -1, -1):
+                c = constraints[i]
+                if c.type != "CHILD_OF":
+                    continue
+                target = c.target
+                if target is not None and target.as_pointer() == armature_ptr:
+                    constraints.remove(c)
 
             # Now, if this object is in our new assignment list, add the new constraint
-            if obj in new_assignments:
-                bone_name = new_assignments[obj]
-                constraint = obj.constraints.new(type="CHILD_OF")
+            bone_name = new_assignments.get(obj)
+            if bone_name is not None:
+                constraint = constraints.new(type="CHILD_OF")
                 constraint.target = armature
                 constraint.subtarget = bone_name
 
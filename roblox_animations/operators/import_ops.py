@@ -34,8 +34,14 @@ def _ensure_all_bone_collections_visible(armature):
                     bc.is_visible = saved[bc.name]
 
 
+# compiled once; these run per part/object during import matching
+_SUFFIX_RE = re.compile(r"\.\d+$")
+_NAME_SEPARATORS_RE = re.compile(r"[\s_]+")
+_INDEXED_PART_RE = re.compile(r"^p(\d+)x1?(\.\d+)?$", re.IGNORECASE)
+
+
 def _strip_suffix(name: str) -> str:
-    return re.sub(r"\.\d+$", "", name or "")
+    return _SUFFIX_RE.sub("", name or "")
 
 
 def _resolve_imported_obj_name(name: str, known_names=None) -> str:
@@ -187,7 +193,7 @@ def _annotate_weapon_original_parents(joints_tree, attachment_parent_name, attac
 def _norm_name(value):
     if not isinstance(value, str):
         return ""
-    return re.sub(r"[\s_]+", "", value).lower()
+    return _NAME_SEPARATORS_RE.sub("", value).lower()
 
 
 def _iter_dicts_recursive(node, depth=0, max_depth=24):
@@ -1581,7 +1587,7 @@ def _rename_indexed_parts(meta_loaded, parts_collection):
     # assigns its own index order which doesn't match GetDescendants order,
     # so the mapping would be wrong. Those rigs fall through to fingerprint
     # matching instead.
-    new_pattern = re.compile(r"^p(\d+)x1?(\.\d+)?$", re.IGNORECASE)
+    new_pattern = _INDEXED_PART_RE
     new_indexed = [
         obj for obj in parts_collection.objects
         if obj.type == "MESH" and new_pattern.match(obj.name)
@@ -3036,10 +3042,13 @@ class OBJECT_OT_ImportModel(bpy.types.Operator, ImportHelper):
             # ---- Apply pending constraints (mesh → bone CHILD_OF) ----
             pending = match_ctx.get("pending_constraints", [])
             applied = 0
+            armature_matrix = armature.matrix_world.copy()
             for obj, bone_name in pending:
                 bone = armature.data.bones.get(bone_name)
                 if bone:
-                    link_object_to_bone_rigid(obj, armature, bone)
+                    link_object_to_bone_rigid(
+                        obj, armature, bone, armature_matrix=armature_matrix
+                    )
                     applied += 1
                     print(f"[WeaponImport] Constrained '{obj.name}' -> "
                           f"bone '{bone_name}'")
@@ -3055,7 +3064,10 @@ class OBJECT_OT_ImportModel(bpy.types.Operator, ImportHelper):
                     target_bone = root_bone_obj or (
                         armature.data.bones.get(parent_bone_name))
                     if target_bone:
-                        link_object_to_bone_rigid(obj, armature, target_bone)
+                        link_object_to_bone_rigid(
+                            obj, armature, target_bone,
+                            armature_matrix=armature_matrix,
+                        )
                         applied += 1
                         print(f"[WeaponImport] Constrained orphan "
                               f"'{obj.name}' -> '{target_bone.name}'")
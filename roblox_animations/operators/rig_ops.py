@@ -4,14 +4,32 @@ Rig generation and management operators.
 
 import bpy
 from ..rig.creation import create_rig
-from ..rig.ik import create_ik_config, remove_ik_config, has_ik_constraint, update_pole_axis
+from ..rig.ik import (
+    create_ik_config,
+    remove_ik_config,
+    has_ik_constraint,
+    update_pole_axis,
+    IK_HELPER_SUFFIXES,
+)
 from ..core.utils import (
     pose_bone_selected,
+    pose_bone_select_getter,
     pose_bone_set_selected,
     iter_scene_objects,
     get_object_by_name,
 )
 
+# physics pulls in gpu/draw code; load it on first use only, then keep the module
+_physics = None
+
+
+def _get_physics():
+    global _physics
+    if _physics is None:
+        from ..rig import physics as _physics_mod
+        _physics = _physics_mod
+    return _physics
+
 
 class OBJECT_OT_GenRig(bpy.types.Operator):
     bl_label = "Generate rig"
@@ -239,12 +257,21 @@ class OBJECT_OT_GenIK(bpy.types.Operator):
             obj
             and obj.mode == "POSE"
             and obj.type == "ARMATURE"
-            and any(pose_bone_selected(b) for b in obj.pose.bones)
+            and any(map(pose_bone_select_getter(), obj.pose.bones))
         )
 
     def execute(self, context):
         obj = context.active_object
-        selected_bones = [b for b in obj.pose.bones if pose_bone_selected(b)]
+        # reuse the walk done in invoke; re-resolve by name since the dialog
+        # may have been open across an undo step
+        cached_names = getattr(self, "_selected_bone_names", None)
+        if cached_names is not None:
+            selected_bones = [
+                pb for pb in map(obj.pose.bones.get, cached_names) if pb is not None
+            ]
+        else:
+            is_selected = pose_bone_select_getter()
+            selected_bones = [b for b in obj.pose.bones if is_selected(b)]
 
         created_helper_names = []
         for bone in selected_bones:
@@ -286,12 +313,15 @@ class OBJECT_OT_GenIK(bpy.types.Operator):
 
     def invoke(self, context, event):
         obj = context.active_object
-        selected_bones = [b for b in obj.pose.bones if pose_bone_selected(b)]
+        is_selected = pose_bone_select_getter()
+        selected_bones = [b for b in obj.pose.bones if is_selected(b)]
 
         if not selected_bones:
             self.report({"WARNING"}, "No bones selected")
             return {"CANCELLED"}
 
+        self._selected_bone_names = [b.name for b in selected_bones]
+
         rec_chain_len = 1
         no_loop_mech = set()
         bone = selected_bones[0].bone
@@ -340,7 +370,8 @@ class OBJECT_OT_ModifyIK(bpy.types.Operator):
             return
         
         # Get selected bones
-        selected_bones = [b for b in obj.pose.bones if pose_bone_selected(b)]
+        is_selected = pose_bone_select_getter()
+        selected_bones = [b for b in obj.pose.bones if is_selected(b)]
         if not selected_bones:
             if hasattr(context, 'active_pose_bone') and context.active_pose_bone:
                 selected_bones = [context.active_pose_bone]
@@ -371,8 +402,9 @@ class OBJECT_OT_ModifyIK(bpy.types.Operator):
         obj = context.active_object
         if not obj or obj.mode != "POSE" or obj.type != "ARMATURE":
             return False
+        is_selected = pose_bone_select_getter()
         return any(
-            has_ik_constraint(obj, b) for b in obj.pose.bones if pose_bone_selected(b)
+            has_ik_constraint(obj, b) for b in obj.pose.bones if is_selected(b)
         )
 
     def execute(self, context):
@@ -403,12 +435,13 @@ class OBJECT_OT_RemoveIK(bpy.types.Operator):
         return (
             obj
             and obj.mode == "POSE"
-            and any(pose_bone_selected(b) for b in obj.pose.bones)
+            and any(map(pose_bone_select_getter(), obj.pose.bones))
         )
 
     def execute(self, context):
         obj = context.active_object
-        selected_bones = [b for b in obj.pose.bones if pose_bone_selected(b)]
+        is_selected = pose_bone_select_getter()
+        selected_bones = [b for b in obj.pose.bones if is_selected(b)]
 
         for bone in selected_bones:
             remove_ik_config(obj, bone)
@@ -435,17 +468,19 @@ class OBJECT_OT_SetIKFK(bpy.types.Operator):
         if not obj or obj.mode != "POSE" or obj.type != "ARMATURE":
             return False
         # Check if any selected bone is an IK target with IK_FK property
+        is_selected = pose_bone_select_getter()
         for b in obj.pose.bones:
-            if pose_bone_selected(b) and b.name.endswith("-IKTarget") and "IK_FK" in b:
+            if is_selected(b) and b.name.endswith("-IKTarget") and "IK_FK" in b:
                 return True
         return False
 
     def execute(self, context):
         obj = context.active_object
         current_frame = context.scene.frame_current
+        is_selected = pose_bone_select_getter()
         
         for b in obj.pose.bones:
-            if pose_bone_selected(b) and b.name.endswith("-IKTarget") and "IK_FK" in b:
+            if is_selected(b) and b.name.endswith("-IKTarget") and "IK_FK" in b:
                 b["IK_FK"] = self.value
                 # Insert keyframe for the IK_FK property
                 b.keyframe_insert(data_path='["IK_FK"]', frame=current_frame)
@@ -567,7 +602,7 @@ class OBJECT_OT_EditCOMWeights(bpy.types.Operator):
         
         for bone in obj.data.bones:
             # Skip IK helper bones
-            if any(bone.name.endswith(s) for s in ("-IKTarget", "-IKPole", "-IKStretch")):
+            if bone.name.endswith(IK_HELPER_SUFFIXES):
                 continue
             
             has_custom = COM_WEIGHT_PROP in bone
@@ -758,26 +793,20 @@ class OBJECT_OT_ToggleAutoPhysics(bpy.types.Operator):
         return obj and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..rig.physics import (
-            is_physics_enabled,
-            enable_physics_visualization,
-            analyze_animation,
-            register_physics_frame_handler,
-            unregister_physics_frame_handler,
-        )
+        physics = _get_physics()
         
         obj = context.active_object
         
-        if is_physics_enabled():
-            enable_physics_visualization(False)
-            unregister_physics_frame_handler()
+        if physics.is_physics_enabled():
+            physics.enable_physics_visualization(False)
+            physics.unregister_physics_frame_handler()
             self.report({"INFO"}, "AutoPhysics disabled")
         else:
             # Analyze the animation first
             self.report({"INFO"}, "Analyzing animation physics...")
-            analyze_animation(obj)
-            enable_physics_visualization(True)
-            register_physics_frame_handler()
+            physics.analyze_animation(obj)
+            physics.enable_physics_visualization(True)
+            physics.register_physics_frame_handler()
             self.report({"INFO"}, "AutoPhysics enabled")
         
         return {"FINISHED"}
@@ -796,12 +825,12 @@ class OBJECT_OT_AnalyzePhysics(bpy.types.Operator):
         return obj and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..rig.physics import analyze_animation, is_physics_enabled
+        physics = _get_physics()
         
         obj = context.active_object
-        analyze_animation(obj)
+        physics.analyze_animation(obj)
         
-        if is_physics_enabled():
+        if physics.is_physics_enabled():
             self.report({"INFO"}, "Physics analysis updated")
         else:
             self.report({"INFO"}, "Physics analyzed (enable AutoPhysics to visualize)")
@@ -822,10 +851,10 @@ class OBJECT_OT_TogglePhysicsGhost(bpy.types.Operator):
         return obj and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..rig.physics import toggle_ghost, is_ghost_enabled
+        physics = _get_physics()
         
-        toggle_ghost()
-        state = "enabled" if is_ghost_enabled() else "disabled"
+        physics.toggle_ghost()
+        state = "enabled" if physics.is_ghost_enabled() else "disabled"
         self.report({"INFO"}, f"Physics ghost {state}")
         
         return {"FINISHED"}
@@ -844,10 +873,10 @@ class OBJECT_OT_ToggleRotationMomentum(bpy.types.Operator):
         return obj and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..rig.physics import toggle_angular_momentum, is_angular_momentum_enabled
+        physics = _get_physics()
         
-        toggle_angular_momentum()
-        state = "enabled" if is_angular_momentum_enabled() else "disabled"
+        physics.toggle_angular_momentum()
+        state = "enabled" if physics.is_angular_momentum_enabled() else "disabled"
         self.report({"INFO"}, f"Rotation momentum {state}")
         
         return {"FINISHED"}
@@ -13,6 +13,12 @@ class OBJECT_OT_RunTests(bpy.types.Operator):
     bl_description = "Run the add-on's Python unit tests inside Blender"
     bl_options = {"REGISTER"}
 
+    parallel: bpy.props.BoolProperty(
+        name="Parallel",
+        description="Run tests not marked @serial on a thread pool",
+        default=False,
+    )
+
     def execute(self, context):
         package_root = Path(__file__).resolve().parent.parent
         tests_dir = package_root / "tests"
@@ -48,10 +54,16 @@ class OBJECT_OT_RunTests(bpy.types.Operator):
             return {"CANCELLED"}
 
         buffer = io.StringIO()
-        runner = unittest.TextTestRunner(stream=buffer, verbosity=2)
 
         try:
-            result = runner.run(suite)
+            if self.parallel:
+                # tests/ is left out of release builds, so only import it here
+                from ..tests.helpers import run_parallel
+
+                result = run_parallel(suite, buffer)
+            else:
+                runner = unittest.TextTestRunner(stream=buffer, verbosity=2)
+                result = runner.run(suite)
         except Exception:  # pragma: no cover - defensive: runtime failure path
             err = traceback.format_exc()
             context.window_manager.clipboard = err
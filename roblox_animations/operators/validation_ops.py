@@ -12,26 +12,102 @@ performs comprehensive validation checks including:
 import bpy
 from bpy.types import Operator
 from mathutils import Vector
-from typing import Dict, List, Tuple, Set
+from typing import Dict, FrozenSet, List, Tuple
 
+from ..animation.sampling import BONE_FCURVE_RE as _BONE_FCURVE_RE, sample_pose_matrices
 from ..animation.serialization import is_deform_bone_rig
 from ..core.utils import get_scene_fps, get_object_by_name
 import math
 
 
+class _ViolationBuffer:
+    """struct-of-arrays store for violation segments.
+
+    segment endpoints live in one float32 (cap, 2, 3) array, so the line batch
+    is a reshape of pos[:n] rather than a walk over per-segment Vectors. bone
+    names are stored as indices into bone_names.
+    """
+
+    __slots__ = ("bone_names", "pos", "frame", "bone_idx", "key_prev", "key_curr", "n")
+
+    def __init__(self, bone_names: List[str] = (), capacity: int = 0):
+        import numpy as np
+
+        self.bone_names = list(bone_names)
+        self.pos = np.empty((capacity, 2, 3), dtype=np.float32)
+        self.frame = np.empty(capacity, dtype=np.int32)
+        self.bone_idx = np.empty(capacity, dtype=np.int32)
+        self.key_prev = np.empty(capacity, dtype=bool)
+        self.key_curr = np.empty(capacity, dtype=bool)
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _reserve(self, needed: int) -> None:
+        import numpy as np
+
+        cap = len(self.frame)
+        if needed <= cap:
+            return
+        # geometric growth keeps repeated extends amortized O(1) per segment
+        cap = max(needed, 2 * cap, 16)
+        for name in ("pos", "frame", "bone_idx", "key_prev", "key_curr"):
+            old = getattr(self, name)
+            new = np.empty((cap,) + old.shape[1:], dtype=old.dtype)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
+    def extend(self, starts, ends, frames, bone_idx, key_prev, key_curr) -> None:
+        """append len(frames) segments from parallel arrays."""
+        count = len(frames)
+        if not count:
+            return
+        self._reserve(self.n + count)
+        sl = slice(self.n, self.n + count)
+        self.pos[sl, 0] = starts
+        self.pos[sl, 1] = ends
+        self.frame[sl] = frames
+        self.bone_idx[sl] = bone_idx
+        self.key_prev[sl] = key_prev
+        self.key_curr[sl] = key_curr
+        self.n += count
+
+    def bone_color_table(self, fallback=(1.0, 0.0, 0.0, 1.0)) -> "np.ndarray":
+        """(len(bone_names), 4) float32 colors from _bone_color_cache."""
+        import numpy as np
+
+        table = np.empty((len(self.bone_names), 4), dtype=np.float32)
+        for i, name in enumerate(self.bone_names):
+            table[i] = _bone_color_cache.get(name, fallback)
+        return table
+
+
 # global state for the draw overlay
-_violation_draw_handler = None  # lines
-_violation_label_draw_handler = None  # labels
-_keyframe_points_draw_handler = None  # keyframe markers
-_floor_limit_draw_handler = None  # floor limit plane
-_violation_segments: List[
-    Tuple[Vector, Vector, int, str, bool, bool]
-] = []  # (start, end, frame, bone_name, key_prev, key_curr)
+_violation_draw_handler = None  # lines, keyframe markers and floor limit (POST_VIEW)
+_violation_label_draw_handler = None  # labels (POST_PIXEL)
+_violation_segments = _ViolationBuffer()  # see _ViolationBuffer
 _bone_color_cache: Dict[str, Tuple[float, float, float, float]] = {}
 _armature_name_for_cache: str = ""
+# brightened per-bone marker colors, resolved at validation time for the keyframe batch
+_keyframe_color_by_bone: Dict[str, Tuple[float, float, float, float]] = {}
 _keyframe_points: List[Tuple[Vector, str, int]] = []  # (location, bone_name, frame)
 _below_root_violations: List[Tuple[Vector, Vector, str]] = []  # (bone_pos, floor_pos, bone_name)
 _floor_limit_z: float = 0.0  # world Z of floor limit
+# gpu (shader, batch) pairs built on first draw; reset whenever the data above changes
+_violation_batch = None
+_keyframe_batch = None
+_endpoint_batch = None
+# precomputed label overlay data, see _build_label_entries
+_label_entries: List[tuple] = []
+_label_points = None
+# builtin shaders resolved once per session, keyed by kind ("uniform" / "smooth")
+_cached_shaders: Dict[str, object] = {}
+
+_SHADER_FALLBACKS = {
+    "uniform": ("UNIFORM_COLOR", "3D_UNIFORM_COLOR", "FLAT_COLOR"),
+    "smooth": ("SMOOTH_COLOR", "3D_SMOOTH_COLOR", "FLAT_COLOR", "3D_FLAT_COLOR"),
+}
 
 # Roblox animation validation constants (matching Lua script)
 ANIM_MAX_DURATION = 10.0  # seconds
@@ -40,6 +116,8 @@ ANIM_MAX_BELOW_ROOT = 3.1  # max studs below root Y
 ANIM_MAX_DELTA = 1.0  # studs per frame
 ANIM_FPS = 30.0  # target fps
 
+_EMPTY_FROZENSET: FrozenSet[int] = frozenset()
+
 
 def _get_bone_display_color(
     pbone: "bpy.types.PoseBone",
@@ -62,66 +140,167 @@ def _get_bone_display_color(
     return (r * 0.8 + 0.2, g * 0.8 + 0.2, b * 0.8 + 0.2, 1.0)
 
 
+def _get_shader(kind: str):
+    """return the builtin shader for kind, walking the per-version name fallbacks only once."""
+    shader = _cached_shaders.get(kind)
+    if shader is not None:
+        return shader
+    import gpu
+
+    for name in _SHADER_FALLBACKS[kind]:
+        try:
+            shader = gpu.shader.from_builtin(name)
+            break
+        except Exception:
+            continue
+    if shader is not None:
+        _cached_shaders[kind] = shader
+    return shader
+
+
+def _refresh_bone_color_cache(armature: "bpy.types.Object") -> None:
+    """resolve display colors for every bone of the validated armature (validation time, not draw time)."""
+    global _armature_name_for_cache
+    _bone_color_cache.clear()
+    _keyframe_color_by_bone.clear()
+    for pb in armature.pose.bones:
+        bc = _get_bone_display_color(pb)
+        _bone_color_cache[pb.name] = bc
+        # slightly brighter for visibility
+        _keyframe_color_by_bone[pb.name] = (
+            min(1.0, bc[0] + 0.25),
+            min(1.0, bc[1] + 0.25),
+            min(1.0, bc[2] + 0.25),
+            1.0,
+        )
+    _armature_name_for_cache = armature.name
+
+
+def _color_batch(shader, prim_type: str, positions: "np.ndarray", colors: "np.ndarray"):
+    """batch positions with per-vertex colors quantized to normalized U8 RGBA.
+
+    the color stream shrinks from 16 to 4 bytes per vertex; the shader still
+    sees a vec4 in [0, 1]. falls back to float colors via batch_for_shader
+    where the explicit vertex format is not available.
+    """
+    import numpy as np
+
+    try:
+        import gpu
+
+        fmt = gpu.types.GPUVertFormat()
+        fmt.attr_add(id="pos", comp_type="F32", len=3, fetch_mode="FLOAT")
+        fmt.attr_add(id="color", comp_type="U8", len=4, fetch_mode="INT_TO_FLOAT_UNIT")
+        vbo = gpu.types.GPUVertBuf(len=len(positions), format=fmt)
+        vbo.attr_fill(id="pos", data=positions)
+        vbo.attr_fill(
+            id="color",
+            data=np.ascontiguousarray(
+                (np.clip(colors, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+            ),
+        )
+        return gpu.types.GPUBatch(type=prim_type, buf=vbo)
+    except Exception:
+        from gpu_extras.batch import batch_for_shader
+
+        return batch_for_shader(shader, prim_type, {"pos": positions, "color": colors})
+
+
+def _build_violation_batch():
+    """build the (shader, batch) pair for the violation lines from _violation_segments."""
+    import numpy as np
+
+    # per-vertex color shader so every segment goes out in one draw call,
+    # no matter how many distinct bone colors there are
+    shader = _get_shader("smooth")
+    if shader is None:
+        return None
+
+    segs = _violation_segments
+    n = segs.n
+    positions = segs.pos[:n].reshape(-1, 3)
+    colors = np.repeat(segs.bone_color_table()[segs.bone_idx[:n]], 2, axis=0)
+
+    return shader, _color_batch(shader, "LINES", positions, colors)
+
+
+def _build_endpoint_batch():
+    """build the (shader, batch) pair for the segment endpoint markers.
+
+    endpoints are dim white, or the brightened bone color where the endpoint
+    sits on a keyframe.
+    """
+    import numpy as np
+
+    shader = _get_shader("smooth")
+    if shader is None:
+        return None
+
+    segs = _violation_segments
+    n = segs.n
+    positions = segs.pos[:n].reshape(-1, 3)
+    bright = segs.bone_color_table()
+    bright[:, :3] = np.minimum(bright[:, :3] + 0.2, 1.0)
+    bright[:, 3] = 1.0
+    bright = bright[segs.bone_idx[:n]]
+    colors = np.empty((n, 2, 4), dtype=np.float32)
+    colors[:] = (1.0, 1.0, 1.0, 0.6)
+    key_prev = segs.key_prev[:n]
+    key_curr = segs.key_curr[:n]
+    colors[key_prev, 0] = bright[key_prev]
+    colors[key_curr, 1] = bright[key_curr]
+    colors = colors.reshape(-1, 4)
+
+    return shader, _color_batch(shader, "POINTS", positions, colors)
+
+
 def _draw_motionpath_violations():
-    """viewport draw callback to render violation segments as red lines."""
+    """render violation segments as lines; drawn from _draw_validation_overlay."""
+    global _violation_batch, _endpoint_batch
     if not _violation_segments:
         return
     try:
         import gpu
-        from gpu_extras.batch import batch_for_shader
     except Exception:
         return
 
-    # shader fallback across blender versions
-    shader = None
-    for name in ("UNIFORM_COLOR", "3D_UNIFORM_COLOR", "FLAT_COLOR"):
+    # the segments only change on validate/clear, so the batch is uploaded
+    # once and reused by every redraw until invalidated
+    if _violation_batch is None:
         try:
-            shader = gpu.shader.from_builtin(name)
-            break
+            _violation_batch = _build_violation_batch()
         except Exception:
-            continue
-    if shader is None:
-        return
+            return
+        if _violation_batch is None:
+            return
+    shader, batch = _violation_batch
 
-    gpu.state.blend_set("ALPHA")
     try:
         gpu.state.line_width_set(2.0)
     except Exception:
         pass
 
-    # build or refresh bone color cache for active armature
-    settings = getattr(bpy.context.scene, "rbx_anim_settings", None)
-    arm_name = settings.rbx_anim_armature if settings else None
-    global _armature_name_for_cache
-    if arm_name != _armature_name_for_cache or not _bone_color_cache:
-        _bone_color_cache.clear()
-        arm = get_object_by_name(arm_name)
-        if arm and arm.type == "ARMATURE":
-            for pb in arm.pose.bones:
-                _bone_color_cache[pb.name] = _get_bone_display_color(pb)
-        _armature_name_for_cache = arm_name
-
-    # batch by color to reduce shader binds
-    by_color: Dict[Tuple[float, float, float, float], List[Vector]] = {}
-    for start, end, _frame, bone_name, _kp, _kc in _violation_segments:
-        color = _bone_color_cache.get(bone_name, (1.0, 0.0, 0.0, 1.0))
-        coords = by_color.setdefault(color, [])
-        coords.append(start)
-        coords.append(end)
-
-    for color, coords in by_color.items():
-        if not coords:
-            continue
-        batch = batch_for_shader(shader, "LINES", {"pos": coords})
+    shader.bind()
+    batch.draw(shader)
+
+    # endpoint markers as one POINTS batch instead of a blf glyph per endpoint
+    if _endpoint_batch is None:
+        try:
+            _endpoint_batch = _build_endpoint_batch()
+        except Exception:
+            _endpoint_batch = None
+    if _endpoint_batch is not None:
+        shader, batch = _endpoint_batch
+        try:
+            gpu.state.point_size_set(8.0)
+        except Exception:
+            pass
         shader.bind()
-        shader.uniform_float("color", color)
         batch.draw(shader)
 
-    gpu.state.blend_set("NONE")
-
 
 def _draw_floor_limit():
-    """Draw floor limit plane and vertical drop lines for below-root violations."""
+    """Draw floor limit plane and vertical drop lines for below-root violations; drawn from _draw_validation_overlay."""
     if not _below_root_violations and _floor_limit_z == 0.0:
         return
     try:
@@ -130,17 +309,10 @@ def _draw_floor_limit():
     except Exception:
         return
 
-    shader = None
-    for name in ("UNIFORM_COLOR", "3D_UNIFORM_COLOR", "FLAT_COLOR"):
-        try:
-            shader = gpu.shader.from_builtin(name)
-            break
-        except Exception:
-            continue
+    shader = _get_shader("uniform")
     if shader is None:
         return
 
-    gpu.state.blend_set("ALPHA")
     try:
         gpu.state.line_width_set(2.0)
     except Exception:
@@ -191,70 +363,86 @@ def _draw_floor_limit():
         shader.uniform_float("color", x_color)
         batch.draw(shader)
 
-    gpu.state.blend_set("NONE")
+
+def _build_keyframe_batch():
+    """build the (shader, batch) pair for the keyframe markers from _keyframe_points."""
+    import numpy as np
+
+    shader = _get_shader("smooth")
+    if shader is None:
+        return None
+
+    positions = np.empty((len(_keyframe_points), 3), dtype=np.float32)
+    colors = np.empty((len(_keyframe_points), 4), dtype=np.float32)
+    for i, (loc, bone_name, _frame) in enumerate(_keyframe_points):
+        positions[i] = loc
+        colors[i] = _keyframe_color_by_bone.get(bone_name, (1.0, 1.0, 1.0, 1.0))
+
+    return shader, _color_batch(shader, "POINTS", positions, colors)
 
 
 def _draw_motionpath_keyframes():
-    """viewport draw callback to render keyframe markers along the path, similar to blender's motion path dots."""
+    """render keyframe markers along the path, similar to blender's motion path dots; drawn from _draw_validation_overlay."""
+    global _keyframe_batch
     if not _keyframe_points:
         return
     try:
         import gpu
-        from gpu_extras.batch import batch_for_shader
     except Exception:
         return
 
-    shader = None
-    for name in ("UNIFORM_COLOR", "3D_UNIFORM_COLOR", "FLAT_COLOR"):
+    if _keyframe_batch is None:
         try:
-            shader = gpu.shader.from_builtin(name)
-            break
+            _keyframe_batch = _build_keyframe_batch()
         except Exception:
-            continue
-    if shader is None:
-        return
+            return
+        if _keyframe_batch is None:
+            return
+    shader, batch = _keyframe_batch
 
-    gpu.state.blend_set("ALPHA")
     try:
         gpu.state.point_size_set(5.0)
     except Exception:
         pass
 
-    # group points by bone to minimize color binds
-    points_by_bone = {}
-    for loc, bone_name, _frame in _keyframe_points:
-        points_by_bone.setdefault(bone_name, []).append(loc)
+    shader.bind()
+    batch.draw(shader)
 
-    for bone_name, pts in points_by_bone.items():
-        settings = getattr(bpy.context.scene, "rbx_anim_settings", None)
-        arm_name = settings.rbx_anim_armature if settings else None
-        arm = get_object_by_name(arm_name)
-        pbone = arm.pose.bones.get(bone_name) if arm else None
-        color = (1.0, 1.0, 1.0, 1.0)
-        if pbone is not None:
-            bc = _get_bone_display_color(pbone)
-            # slightly brighter for visibility
-            color = (
-                min(1.0, bc[0] + 0.25),
-                min(1.0, bc[1] + 0.25),
-                min(1.0, bc[2] + 0.25),
-                1.0,
-            )
-        batch = batch_for_shader(shader, "POINTS", {"pos": pts})
-        shader.bind()
-        shader.uniform_float("color", color)
-        batch.draw(shader)
 
-    gpu.state.blend_set("NONE")
+def _draw_validation_overlay():
+    """single POST_VIEW callback for the violation lines, keyframe markers and floor limit.
+
+    one python dispatch and one blend state toggle per redraw instead of one
+    per overlay layer.
+    """
+    if not (
+        _violation_segments
+        or _keyframe_points
+        or _below_root_violations
+        or _floor_limit_z != 0.0
+    ):
+        return
+    try:
+        import gpu
+    except Exception:
+        return
+
+    gpu.state.blend_set("ALPHA")
+    try:
+        _draw_motionpath_violations()
+        _draw_motionpath_keyframes()
+        _draw_floor_limit()
+    finally:
+        gpu.state.blend_set("NONE")
 
 
 def _draw_motionpath_labels():
     """overlay callback to render frame labels near violation segments."""
-    if not _violation_segments:
+    if not _label_entries or _label_points is None:
         return
     try:
         import blf
-        from bpy_extras import view3d_utils
+        import numpy as np
     except Exception:
         return
 
@@ -270,17 +458,21 @@ def _draw_motionpath_labels():
     except Exception:
         pass
 
-    for start, end, frame, bone_name, _kp, _kc in _violation_segments:
-        mid = (start + end) * 0.5
-        pos2d = view3d_utils.location_3d_to_region_2d(region, rv3d, mid)
-        if not pos2d:
+    # project every label anchor in one matmul (same math as
+    # view3d_utils.location_3d_to_region_2d, including the w > 0 cull)
+    clip = _label_points @ np.array(rv3d.perspective_matrix, dtype=np.float64).T
+    w = clip[:, 3]
+    visible = w > 0.0
+    half = np.array((region.width * 0.5, region.height * 0.5))
+    xy = np.zeros((len(w), 2))
+    xy[visible] = half + half * clip[visible, :2] / w[visible, None]
+
+    for (text, label_col), (x, y), is_visible in zip(_label_entries, xy.tolist(), visible.tolist()):
+        if not is_visible:
             continue
-        text = f"{bone_name}  f:{frame}"
         # small offset to avoid drawing on top of the line
-        x = pos2d.x + 4
-        y = pos2d.y + 4
-        # match label color to line (bone) color (use cache)
-        label_col = _bone_color_cache.get(bone_name, (1.0, 0.0, 0.0, 1.0))
+        x += 4
+        y += 4
         try:
             blf.position(font_id, x, y, 0)
             blf.color(font_id, *label_col)
@@ -290,53 +482,32 @@ def _draw_motionpath_labels():
             blf.position(font_id, x, y, 0)
             blf.draw(font_id, text)
 
-        # draw keyframe markers as bullets at endpoints
-        # compute endpoints in 2d
-        bc = _bone_color_cache.get(bone_name, (1.0, 0.0, 0.0, 1.0))
-        bcol = (
-            min(1.0, bc[0] + 0.2),
-            min(1.0, bc[1] + 0.2),
-            min(1.0, bc[2] + 0.2),
-            1.0,
-        )
 
-        start2d = view3d_utils.location_3d_to_region_2d(region, rv3d, start)
-        end2d = view3d_utils.location_3d_to_region_2d(region, rv3d, end)
-        try:
-            blf.size(font_id, 18, dpi)
-        except Exception:
-            pass
-        # draw dim base markers at endpoints for visibility (skip if too many to keep fps)
-        many_segments = len(_violation_segments) > 800
-        if start2d and not many_segments:
-            try:
-                blf.color(font_id, 1.0, 1.0, 1.0, 0.6)
-            except Exception:
-                pass
-            blf.position(font_id, start2d.x - 4, start2d.y - 4, 0)
-            blf.draw(font_id, "■")
-        if end2d and not many_segments:
-            try:
-                blf.color(font_id, 1.0, 1.0, 1.0, 0.6)
-            except Exception:
-                pass
-            blf.position(font_id, end2d.x - 4, end2d.y - 4, 0)
-            blf.draw(font_id, "■")
-        # highlight if keyframe
-        if _kp and start2d:
-            try:
-                blf.color(font_id, *bcol)
-            except Exception:
-                pass
-            blf.position(font_id, start2d.x - 4, start2d.y - 4, 0)
-            blf.draw(font_id, "■")
-        if _kc and end2d:
-            try:
-                blf.color(font_id, *bcol)
-            except Exception:
-                pass
-            blf.position(font_id, end2d.x - 4, end2d.y - 4, 0)
-            blf.draw(font_id, "■")
+def _build_label_entries() -> Tuple[object, List[tuple]]:
+    """precompute everything the label overlay needs from _violation_segments.
+
+    returns (points, entries): points is an (S, 4) homogeneous array of
+    segment midpoints, entries are the matching (text, label_color) pairs.
+    only the projection is left for the draw callback.
+    """
+    import numpy as np
+
+    segs = _violation_segments
+    n = segs.n
+    points = np.ones((n, 4), dtype=np.float64)
+    points[:, :3] = segs.pos[:n].mean(axis=1)
+    bone_names = segs.bone_names
+    entries = []
+    for frame, bi in zip(segs.frame[:n].tolist(), segs.bone_idx[:n].tolist()):
+        bone_name = bone_names[bi]
+        # match label color to line (bone) color
+        entries.append(
+            (
+                f"{bone_name}  f:{frame}",
+                _bone_color_cache.get(bone_name, (1.0, 0.0, 0.0, 1.0)),
+            )
+        )
+    return points, entries
 
 
 def _validate_animation_duration(scene, fps: float) -> List[str]:
@@ -353,111 +524,186 @@ def _validate_animation_duration(scene, fps: float) -> List[str]:
 
 
 def _validate_bounds(
-    positions: Dict[str, Vector], root_pos: Vector, scale: float
-) -> List[Tuple[str, str]]:
-    """Validate bone positions against bounds from root."""
+    all_pos: "np.ndarray",
+    root_pos: "np.ndarray",
+    scale: float,
+    bone_names: List[str],
+    frame_start: int,
+) -> List[Tuple[int, str, str]]:
+    """Validate bone positions against bounds from root over every frame at once.
+
+    all_pos is (F, N, 3) bone heads, root_pos is (F, 3); returns
+    (frame, bone_name, message) for each offending pair.
+    """
+    import numpy as np
+
+    distances = np.linalg.norm(root_pos[:, None, :] - all_pos, axis=2) / scale
     violations = []
 
-    for bone_name, pos in positions.items():
-        offset = root_pos - pos
-        distance = offset.length / scale
-
-        if distance > ANIM_MAX_BOUNDS:
-            violations.append(
-                (
-                    bone_name,
-                    f"Bone '{bone_name}' is {distance:.2f} studs from root (max: {ANIM_MAX_BOUNDS})",
-                )
+    for fi, bi in np.argwhere(distances > ANIM_MAX_BOUNDS).tolist():
+        bone_name = bone_names[bi]
+        violations.append(
+            (
+                frame_start + fi,
+                bone_name,
+                f"Bone '{bone_name}' is {distances[fi, bi]:.2f} studs from root (max: {ANIM_MAX_BOUNDS})",
             )
+        )
 
     return violations
 
 
 def _validate_below_root(
-    positions: Dict[str, Vector], root_pos: Vector, scale: float
-) -> List[Tuple[str, str]]:
-    """Validate bones aren't too far below root Y position."""
+    all_pos: "np.ndarray",
+    root_pos: "np.ndarray",
+    scale: float,
+    bone_names: List[str],
+) -> List[Tuple[int, int, str]]:
+    """Validate bones aren't too far below root Y position, over every frame at once.
+
+    all_pos is (F, N, 3) bone heads, root_pos is (F, 3); returns
+    (frame_index, bone_index, message) for each offending pair so callers
+    can reach the offending position without a name lookup.
+    """
+    import numpy as np
+
+    # blender Z = roblox Y
+    depths = (root_pos[:, None, 2] - all_pos[:, :, 2]) / scale
     violations = []
-    root_y = root_pos.z  # blender Z = roblox Y
 
-    for bone_name, pos in positions.items():
-        depth = (root_y - pos.z) / scale
-        if depth > ANIM_MAX_BELOW_ROOT:
-            violations.append((
-                bone_name,
-                f"Bone '{bone_name}' is {depth:.2f} studs below root (max: {ANIM_MAX_BELOW_ROOT})",
-            ))
+    for fi, bi in np.argwhere(depths > ANIM_MAX_BELOW_ROOT).tolist():
+        violations.append(
+            (
+                fi,
+                bi,
+                f"Bone '{bone_names[bi]}' is {depths[fi, bi]:.2f} studs below root (max: {ANIM_MAX_BELOW_ROOT})",
+            )
+        )
 
     return violations
 
 
-def _validate_rotation_constraints(
-    armature_obj: "bpy.types.Object", evaluated_obj: "bpy.types.Object"
-) -> List[str]:
-    """Validate bone rotations for proper constraints."""
-    warnings = []
+def _quats_to_euler_xyz(quats: "np.ndarray") -> "np.ndarray":
+    """vectorized quaternion (w, x, y, z) -> XYZ euler, (N, 4) -> (N, 3); matches Quaternion.to_euler()."""
+    import numpy as np
 
-    for pbone in evaluated_obj.pose.bones:
-        # Check for extreme rotations that might cause issues
-        rot = pbone.rotation_quaternion
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    w, x, y, z = (quats / norms).T
+    return np.stack(
+        (
+            np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y)),
+            np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0)),
+            np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z)),
+        ),
+        axis=1,
+    )
 
-        # Check for NaN or infinite values
-        if any(math.isnan(x) or math.isinf(x) for x in rot):
-            warnings.append(f"Bone '{pbone.name}' has invalid rotation (NaN/Inf)")
-            continue
 
-        # Check for extreme rotation angles (more than 180 degrees in any axis)
-        euler = rot.to_euler()
-        max_angle = max(abs(euler.x), abs(euler.y), abs(euler.z))
+def _rotation_warnings(quats: "np.ndarray", names: List[str]) -> List[str]:
+    """flag NaN/Inf and extreme rotations in an (N, 4) array of quaternions named by names."""
+    import numpy as np
 
-        if max_angle > math.pi:  # 180 degrees
+    warnings = []
+    n = len(names)
+    if n == 0:
+        return warnings
+
+    # Check for NaN or infinite values
+    valid = np.isfinite(quats).all(axis=1)
+
+    # Check for extreme rotation angles (more than 180 degrees in any axis)
+    max_angles = np.zeros(n)
+    if valid.any():
+        max_angles[valid] = np.abs(_quats_to_euler_xyz(quats[valid])).max(axis=1)
+    extreme = valid & (max_angles > math.pi)
+
+    # only the flagged bones are touched again from python
+    for i in np.flatnonzero(~valid | extreme):
+        name = names[i]
+        if not valid[i]:
+            warnings.append(f"Bone '{name}' has invalid rotation (NaN/Inf)")
+        else:
             warnings.append(
-                f"Bone '{pbone.name}' has extreme rotation: {math.degrees(max_angle):.1f}°"
+                f"Bone '{name}' has extreme rotation: {math.degrees(max_angles[i]):.1f}°"
             )
 
     return warnings
 
 
-def _collect_bone_world_head(
+def _validate_rotation_constraints(
     armature_obj: "bpy.types.Object", evaluated_obj: "bpy.types.Object"
-) -> Dict[str, Vector]:
-    """return world-space head positions for relevant bones on the evaluated armature."""
-    positions: Dict[str, Vector] = {}
-    # determine which bones to include
-    settings = getattr(bpy.context.scene, "rbx_anim_settings", None)
-    force_deform = getattr(settings, "force_deform_bone_serialization", False)
-    is_deform = is_deform_bone_rig(armature_obj) or force_deform
-
-    world_mat = evaluated_obj.matrix_world
-    for pbone in evaluated_obj.pose.bones:
-        if is_deform:
-            if not pbone.bone.use_deform:
-                continue
-        else:
-            if "is_transformable" not in pbone.bone:
-                continue
-        # pbone.head is in armature space
-        head_world = world_mat @ pbone.head
-        positions[pbone.name] = head_world
-    return positions
+) -> List[str]:
+    """Validate bone rotations for proper constraints."""
+    import numpy as np
+
+    pose_bones = evaluated_obj.pose.bones
+    n = len(pose_bones)
+    quats = np.fromiter(
+        (c for pbone in pose_bones for c in pbone.rotation_quaternion),
+        dtype=np.float64,
+        count=4 * n,
+    ).reshape(n, 4)
+    return _rotation_warnings(quats, [pbone.name for pbone in pose_bones])
+
+
+def _get_relevant_bone_names(armature_obj: "bpy.types.Object", is_deform: bool) -> List[str]:
+    """return names of the bones that get validated (deform bones or transformable motor6d bones)."""
+    if is_deform:
+        return [pb.name for pb in armature_obj.pose.bones if pb.bone.use_deform]
+    return [pb.name for pb in armature_obj.pose.bones if "is_transformable" in pb.bone]
+
+
+def _collect_bone_world_heads(evaluated_obj: "bpy.types.Object") -> "np.ndarray":
+    """return an (M, 3) array of world-space head positions for every pose bone, in pose.bones order.
+
+    heads are read with a single foreach_get and transformed with the 3x3
+    linear part plus translation of matrix_world (no homogeneous column);
+    callers index the result with bone indices resolved once per validation
+    instead of looking bones up by name every frame.
+    """
+    import numpy as np
+
+    pose_bones = evaluated_obj.pose.bones
+    m = len(pose_bones)
+    flat = np.empty(3 * m, dtype=np.float32)
+    # pbone.head is in armature space
+    pose_bones.foreach_get("head", flat)
+    world_mat = np.array(evaluated_obj.matrix_world, dtype=np.float64)
+    linear = world_mat[:3, :3]
+    trans = world_mat[:3, 3]
+    return flat.reshape(m, 3).astype(np.float64) @ linear.T + trans
+
+
+def _get_root_bone_name(armature_obj: "bpy.types.Object"):
+    """Return the name of the bone used as the validation root, or None.
+
+    Bone names and hierarchy don't change while frames are sampled, so this
+    is resolved once per validation rather than per frame.
+    """
+    # Prefer an explicit root bone name if present
+    for name in ("Root", "root"):
+        if armature_obj.pose.bones.get(name) is not None:
+            return name
+
+    # Fallback: first bone with no parent
+    for pbone in armature_obj.pose.bones:
+        if pbone.parent is None:
+            return pbone.name
+
+    return None
 
 
 def _get_root_world_pos(
-    armature_obj: "bpy.types.Object", evaluated_obj: "bpy.types.Object"
+    armature_obj: "bpy.types.Object",
+    evaluated_obj: "bpy.types.Object",
+    root_bone_name,
 ) -> Vector:
     """Return world-space root position based on pose bones (per-frame)."""
-    world_mat = evaluated_obj.matrix_world
-
-    # Prefer an explicit root bone name if present
-    for name in ("Root", "root"):
-        pbone = evaluated_obj.pose.bones.get(name)
+    if root_bone_name is not None:
+        pbone = evaluated_obj.pose.bones.get(root_bone_name)
         if pbone is not None:
-            return world_mat @ pbone.head
-
-    # Fallback: first bone with no parent
-    for pbone in evaluated_obj.pose.bones:
-        if pbone.parent is None:
-            return world_mat @ pbone.head
+            return evaluated_obj.matrix_world @ pbone.head
 
     # Final fallback: armature object origin (or parent if present)
     if armature_obj.parent:
@@ -465,6 +711,78 @@ def _get_root_world_pos(
     return armature_obj.matrix_world.translation.copy()
 
 
+def _sample_action_frames(
+    armature_obj: "bpy.types.Object",
+    action,
+    bone_names: List[str],
+    root_bone_name,
+    frame_start: int,
+    frame_end: int,
+):
+    """evaluate the frame range straight from fcurves plus a vectorized FK pass.
+
+    skips scene.frame_set and the depsgraph re-evaluation per frame. returns
+    None when the rig needs the depsgraph (see can_sample_action_directly),
+    otherwise (heads (F, N, 3), roots (F, 3), quats (F, M, 4), quat_names)
+    matching what the frame_set path collects.
+    """
+    import numpy as np
+
+    frames = range(frame_start, frame_end + 1)
+    sampled = sample_pose_matrices(armature_obj, action, frames)
+    if sampled is None:
+        return None
+    pose_mats, quats = sampled
+
+    names = [pb.name for pb in armature_obj.pose.bones]
+    index = {name: i for i, name in enumerate(names)}
+
+    world_mat = np.array(armature_obj.matrix_world, dtype=np.float64)
+    heads_world = pose_mats[:, :, :3, 3] @ world_mat[:3, :3].T + world_mat[:3, 3]
+
+    heads = heads_world[:, [index[name] for name in bone_names]]
+    if root_bone_name is not None and root_bone_name in index:
+        roots = heads_world[:, index[root_bone_name]]
+    else:
+        roots = np.repeat(world_mat[None, :3, 3], len(frames), axis=0)
+    return heads, roots, quats, names
+
+
+def _sample_scene_frames(
+    scene,
+    depsgraph,
+    armature_obj: "bpy.types.Object",
+    bone_indices: "np.ndarray",
+    root_index,
+    frame_start: int,
+    frame_end: int,
+    check_rotations: bool,
+):
+    """evaluate the frame range through scene.frame_set + the depsgraph.
+
+    the general path for rigs _sample_action_frames can't handle. returns
+    (heads per frame (N, 3), root Vector per frame, rotation warnings per
+    frame); the warning list is empty when check_rotations is off.
+    """
+    frame_heads = []
+    root_positions = []
+    frame_rotation_warnings = []
+    for f in range(frame_start, frame_end + 1):
+        scene.frame_set(f)
+        arm_eval = armature_obj.evaluated_get(depsgraph)
+        world_heads = _collect_bone_world_heads(arm_eval)
+        if root_index is not None:
+            root_positions.append(Vector(world_heads[root_index]))
+        else:
+            root_positions.append(_get_root_world_pos(armature_obj, arm_eval, None))
+        frame_heads.append(world_heads[bone_indices])
+        if check_rotations:
+            frame_rotation_warnings.append(
+                _validate_rotation_constraints(armature_obj, arm_eval)
+            )
+    return frame_heads, root_positions, frame_rotation_warnings
+
+
 class OBJECT_OT_ValidateMotionPaths(Operator):
     bl_label = "Validate Motion Paths (Roblox)"
     bl_idname = "object.rbxanims_validate_motionpaths"
@@ -472,9 +790,15 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
 
     @classmethod
     def poll(cls, context):
-        settings = getattr(context.scene, "rbx_anim_settings", None)
+        scene = context.scene
+        settings = getattr(scene, "rbx_anim_settings", None)
         arm_name = settings.rbx_anim_armature if settings else None
-        obj = get_object_by_name(arm_name)
+        if not arm_name:
+            return False
+        # poll runs on every panel redraw; hand over the scene we already
+        # hold instead of letting the lookup go back through bpy.context.
+        # the object itself is not cached: ID references do not survive undo
+        obj = get_object_by_name(arm_name, scene)
         return bool(obj and obj.type == "ARMATURE")
 
     def execute(self, context):
@@ -483,15 +807,18 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
             _violation_draw_handler, \
             _violation_label_draw_handler, \
             _keyframe_points, \
-            _keyframe_points_draw_handler, \
-            _floor_limit_draw_handler, \
             _below_root_violations, \
-            _floor_limit_z
+            _floor_limit_z, \
+            _violation_batch, \
+            _keyframe_batch, \
+            _endpoint_batch, \
+            _label_entries, \
+            _label_points
 
         scene = context.scene
         settings = getattr(scene, "rbx_anim_settings", None)
         arm_name = settings.rbx_anim_armature if settings else None
-        armature = get_object_by_name(arm_name)
+        armature = get_object_by_name(arm_name, scene)
         if not armature or armature.type != "ARMATURE":
             self.report({"ERROR"}, "no valid armature selected")
             return {"CANCELLED"}
@@ -503,6 +830,9 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
             or ANIM_MAX_DELTA
         )
 
+        check_bounds = getattr(settings, "rbx_validate_bounds_per_frame", True)
+        check_rotations = getattr(settings, "rbx_validate_rotations_per_frame", True)
+
         force_deform = getattr(settings, "force_deform_bone_serialization", False)
         deform_scale = getattr(settings, "rbx_deform_rig_scale", 1.0)
 
@@ -517,6 +847,9 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
         # Comprehensive validation checks
         all_warnings = []
         all_violations = []
+        # per-frame diagnostics go to the console in one block; reporting
+        # each one through self.report floods the info log and redraws it
+        violation_msgs = []
         _below_root_violations = []
         _floor_limit_z = 0.0
 
@@ -524,108 +857,168 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
         duration_warnings = _validate_animation_duration(scene, fps)
         all_warnings.extend(duration_warnings)
 
-        last_positions: Dict[str, Vector] = {}
-        _violation_segments = []
+        _violation_segments = _ViolationBuffer()
         total_violations = 0
         _keyframe_points = []
+        _violation_batch = None
+        _keyframe_batch = None
+        _endpoint_batch = None
+        _label_entries = []
+        _label_points = None
 
         # collect keyframe frames per bone from active action (if any)
-        bone_keyframes: Dict[str, Set[int]] = {}
+        bone_keyframes: Dict[str, FrozenSet[int]] = {}
         action = armature.animation_data.action if armature.animation_data else None
         if action is not None:
-            import re
             from ..core.utils import get_action_fcurves
 
             fcurves = get_action_fcurves(action)
+            # x/y/z/w channels share a data_path; parse each path only once
+            bone_by_path: Dict[str, str] = {}
             for fcurve in fcurves:
-                if not fcurve.data_path.startswith("pose.bones"):
-                    continue
-                m = re.search(r'pose\\.bones\["(.+?)"\]', fcurve.data_path)
-                if not m:
-                    continue
-                bname = m.group(1)
+                data_path = fcurve.data_path
+                bname = bone_by_path.get(data_path)
+                if bname is None:
+                    if not data_path.startswith("pose.bones"):
+                        continue
+                    # blender groups bone channels under the bone name
+                    group = fcurve.group
+                    if group is not None and data_path.startswith(
+                        f'pose.bones["{group.name}"]'
+                    ):
+                        bname = group.name
+                    else:
+                        m = _BONE_FCURVE_RE.search(data_path)
+                        if not m:
+                            continue
+                        bname = m.group(1)
+                    bone_by_path[data_path] = bname
                 frames = bone_keyframes.setdefault(bname, set())
                 for kp in fcurve.keyframe_points:
                     frames.add(int(round(kp.co.x)))
+            bone_keyframes = {k: frozenset(v) for k, v in bone_keyframes.items()}
+
+        import numpy as np
+
+        # the bone filter, root bone and floor offset are frame-invariant;
+        # resolve them once
+        bone_names = _get_relevant_bone_names(armature, is_deform)
+        root_bone_name = _get_root_bone_name(armature)
+        below_root_offset = ANIM_MAX_BELOW_ROOT * scale
+        _refresh_bone_color_cache(armature)
+        _violation_segments = _ViolationBuffer(bone_names)
+        # evaluated copies keep pose.bones order, so names resolve to indices once
+        pbone_index = {pb.name: i for i, pb in enumerate(armature.pose.bones)}
+        bone_indices = np.array([pbone_index[name] for name in bone_names], dtype=np.intp)
+        root_index = pbone_index.get(root_bone_name) if root_bone_name is not None else None
+
+        # sample every frame: straight from the action when the rig allows
+        # it, otherwise through scene.frame_set + depsgraph evaluation
+        sampled = None
+        if action is not None:
+            sampled = _sample_action_frames(
+                armature, action, bone_names, root_bone_name, frame_start, frame_end
+            )
+        if sampled is not None:
+            sampled_heads, sampled_roots, sampled_quats, quat_names = sampled
+            frame_heads = list(sampled_heads)
+            root_positions = [Vector(r) for r in sampled_roots]
+            frame_rotation_warnings = (
+                [_rotation_warnings(q, quat_names) for q in sampled_quats]
+                if check_rotations
+                else []
+            )
+        else:
+            frame_heads, root_positions, frame_rotation_warnings = _sample_scene_frames(
+                scene,
+                depsgraph,
+                armature,
+                bone_indices,
+                root_index,
+                frame_start,
+                frame_end,
+                check_rotations,
+            )
 
-        # iterate frames
-        for f in range(frame_start, frame_end + 1):
-            scene.frame_set(f)
-            arm_eval = armature.evaluated_get(depsgraph)
-            root_pos = _get_root_world_pos(armature, arm_eval)
-            positions = _collect_bone_world_head(armature, arm_eval)
-
-            # Set floor limit Z once (first frame with valid root)
-            if root_pos is not None and _floor_limit_z == 0.0:
-                _floor_limit_z = root_pos.z - (ANIM_MAX_BELOW_ROOT * scale)
-
-            # 3. Bounds validation (check every frame)
-            if root_pos is not None:
-                bounds_violations = _validate_bounds(positions, root_pos, scale)
-                for bone_name, violation_msg in bounds_violations:
-                    all_violations.append((f, bone_name, violation_msg))
-                    self.report({"WARNING"}, f"[frame {f}] {violation_msg}")
-
-            # 4. Below-root validation (check every frame)
-            if root_pos is not None:
-                floor_z = root_pos.z - (ANIM_MAX_BELOW_ROOT * scale)
-                below_violations = _validate_below_root(positions, root_pos, scale)
-                for bone_name, violation_msg in below_violations:
-                    all_violations.append((f, bone_name, violation_msg))
-                    self.report({"WARNING"}, f"[frame {f}] {violation_msg}")
-                    # Add to visual list
-                    bone_pos = positions.get(bone_name)
-                    if bone_pos:
-                        floor_pos = Vector((bone_pos.x, bone_pos.y, floor_z))
-                        _below_root_violations.append((bone_pos.copy(), floor_pos, bone_name))
-
-            # 5. Rotation validation (check every frame)
-            rotation_warnings = _validate_rotation_constraints(armature, arm_eval)
+        # 5. Rotation validation (check every frame)
+        for f, rotation_warnings in zip(
+            range(frame_start, frame_end + 1), frame_rotation_warnings
+        ):
             for warning in rotation_warnings:
                 all_warnings.append(f"[frame {f}] {warning}")
-                self.report({"WARNING"}, f"[frame {f}] {warning}")
-
-            for bone_name, pos in positions.items():
-                prev = last_positions.get(bone_name)
-                if prev is not None:
-                    dist_blender = (pos - prev).length
-                    studs = dist_blender / scale
-                    if studs > max_studs:
-                        frames = bone_keyframes.get(bone_name, set())
-                        key_prev = (f - 1) in frames
-                        key_curr = f in frames
-                        _violation_segments.append(
-                            (prev.copy(), pos.copy(), f, bone_name, key_prev, key_curr)
-                        )
-                        total_violations += 1
-                        self.report(
-                            {"WARNING"},
-                            f"[frame {f}] bone '{bone_name}' moved {studs:.3f} studs (> {max_studs})",
+
+        # per-bone checks run once over the stacked (F, N, 3) array; messages
+        # are only formatted for the offending (frame, bone) pairs
+        if frame_heads:
+            all_pos = np.stack(frame_heads)
+            roots = np.array([tuple(r) for r in root_positions], dtype=np.float64)
+
+            # Set floor limit Z once (first sampled frame)
+            if _floor_limit_z == 0.0:
+                _floor_limit_z = float(roots[0, 2]) - below_root_offset
+
+            # 4. Below-root validation (every frame, one broadcast)
+            for fi, bi, violation_msg in _validate_below_root(
+                all_pos, roots, scale, bone_names
+            ):
+                f = frame_start + fi
+                bone_name = bone_names[bi]
+                all_violations.append((f, bone_name, violation_msg))
+                violation_msgs.append(f"[frame {f}] {violation_msg}")
+                # Add to visual list
+                bone_pos = Vector(all_pos[fi, bi])
+                floor_pos = Vector((bone_pos.x, bone_pos.y, roots[fi, 2] - below_root_offset))
+                _below_root_violations.append((bone_pos, floor_pos, bone_name))
+
+            # 3. Bounds validation (every frame, one broadcast)
+            if check_bounds:
+                for f, bone_name, violation_msg in _validate_bounds(
+                    all_pos, roots, scale, bone_names, frame_start
+                ):
+                    all_violations.append((f, bone_name, violation_msg))
+                    violation_msgs.append(f"[frame {f}] {violation_msg}")
+
+            # per-frame displacement of every bone; only the sparse
+            # violating (frame, bone) pairs are visited in python
+            deltas = np.linalg.norm(np.diff(all_pos, axis=0), axis=2) / scale
+            hits = np.argwhere(deltas > max_studs)
+            if len(hits):
+                fi, bi = hits[:, 0], hits[:, 1]
+                seg_frames = frame_start + fi + 1
+                key_prev = np.empty(len(hits), dtype=bool)
+                key_curr = np.empty(len(hits), dtype=bool)
+                for i, (f, b) in enumerate(zip(seg_frames.tolist(), bi.tolist())):
+                    bone_name = bone_names[b]
+                    frames = bone_keyframes.get(bone_name, _EMPTY_FROZENSET)
+                    key_prev[i] = (f - 1) in frames
+                    key_curr[i] = f in frames
+                    violation_msgs.append(
+                        f"[frame {f}] bone '{bone_name}' moved {deltas[fi[i], b]:.3f} studs (> {max_studs})"
+                    )
+                _violation_segments.extend(
+                    all_pos[fi, bi], all_pos[fi + 1, bi], seg_frames, bi, key_prev, key_curr
+                )
+                total_violations += len(hits)
+
+            # record keyframe points for bones keyed inside the frame range
+            for bi, bone_name in enumerate(bone_names):
+                for f in sorted(bone_keyframes.get(bone_name, _EMPTY_FROZENSET)):
+                    if frame_start <= f <= frame_end:
+                        _keyframe_points.append(
+                            (Vector(all_pos[f - frame_start, bi]), bone_name, f)
                         )
-                last_positions[bone_name] = pos
 
-                # record keyframe point if this bone has a key at this frame
-                frames = bone_keyframes.get(bone_name, set())
-                if f in frames:
-                    _keyframe_points.append((pos.copy(), bone_name, f))
+        _label_points, _label_entries = _build_label_entries()
 
         # install draw handlers if not present
         if _violation_draw_handler is None:
             _violation_draw_handler = bpy.types.SpaceView3D.draw_handler_add(
-                _draw_motionpath_violations, (), "WINDOW", "POST_VIEW"
+                _draw_validation_overlay, (), "WINDOW", "POST_VIEW"
             )
         if _violation_label_draw_handler is None:
             _violation_label_draw_handler = bpy.types.SpaceView3D.draw_handler_add(
                 _draw_motionpath_labels, (), "WINDOW", "POST_PIXEL"
             )
-        if _keyframe_points_draw_handler is None:
-            _keyframe_points_draw_handler = bpy.types.SpaceView3D.draw_handler_add(
-                _draw_motionpath_keyframes, (), "WINDOW", "POST_VIEW"
-            )
-        if _floor_limit_draw_handler is None:
-            _floor_limit_draw_handler = bpy.types.SpaceView3D.draw_handler_add(
-                _draw_floor_limit, (), "WINDOW", "POST_VIEW"
-            )
 
         settings = getattr(scene, "rbx_anim_settings", None)
         if settings:
@@ -642,8 +1035,18 @@ class OBJECT_OT_ValidateMotionPaths(Operator):
             summary_msg += f", {total_bounds_violations} bounds violations"
 
         self.report({"INFO"}, summary_msg)
+        issue_count = len(violation_msgs) + len(all_warnings)
+        if issue_count:
+            self.report(
+                {"WARNING"},
+                f"{issue_count} validation issues; see the system console for details",
+            )
 
-        # Log detailed warnings to console
+        # Log detailed violations and warnings to console
+        if violation_msgs:
+            print("=== ANIMATION VALIDATION VIOLATIONS ===")
+            print("\n".join(violation_msgs))
+            print("=======================================")
         if all_warnings:
             print("=== ANIMATION VALIDATION WARNINGS ===")
             for warning in all_warnings:
@@ -664,15 +1067,23 @@ class OBJECT_OT_ClearMotionPathValidation(Operator):
             _violation_draw_handler, \
             _violation_label_draw_handler, \
             _keyframe_points, \
-            _keyframe_points_draw_handler, \
-            _floor_limit_draw_handler, \
             _below_root_violations, \
-            _floor_limit_z
-
-        _violation_segments = []
+            _floor_limit_z, \
+            _violation_batch, \
+            _keyframe_batch, \
+            _endpoint_batch, \
+            _label_entries, \
+            _label_points
+
+        _violation_segments = _ViolationBuffer()
         _keyframe_points = []
         _below_root_violations = []
         _floor_limit_z = 0.0
+        _violation_batch = None
+        _keyframe_batch = None
+        _endpoint_batch = None
+        _label_entries = []
+        _label_points = None
         if _violation_draw_handler is not None:
             try:
                 bpy.types.SpaceView3D.draw_handler_remove(
@@ -689,22 +1100,6 @@ class OBJECT_OT_ClearMotionPathValidation(Operator):
             except Exception:
                 pass
             _violation_label_draw_handler = None
-        if _keyframe_points_draw_handler is not None:
-            try:
-                bpy.types.SpaceView3D.draw_handler_remove(
-                    _keyframe_points_draw_handler, "WINDOW"
-                )
-            except Exception:
-                pass
-            _keyframe_points_draw_handler = None
-        if _floor_limit_draw_handler is not None:
-            try:
-                bpy.types.SpaceView3D.draw_handler_remove(
-                    _floor_limit_draw_handler, "WINDOW"
-                )
-            except Exception:
-                pass
-            _floor_limit_draw_handler = None
 
         settings = getattr(context.scene, "rbx_anim_settings", None)
         if settings:
@@ -726,14 +1121,22 @@ def cleanup_validation_draw_handlers():
         _violation_draw_handler, \
         _violation_label_draw_handler, \
         _keyframe_points, \
-        _keyframe_points_draw_handler, \
-        _floor_limit_draw_handler, \
         _below_root_violations, \
-        _floor_limit_z
-    _violation_segments = []
+        _floor_limit_z, \
+        _violation_batch, \
+        _keyframe_batch, \
+        _endpoint_batch, \
+        _label_entries, \
+        _label_points
+    _violation_segments = _ViolationBuffer()
     _keyframe_points = []
     _below_root_violations = []
     _floor_limit_z = 0.0
+    _violation_batch = None
+    _keyframe_batch = None
+    _endpoint_batch = None
+    _label_entries = []
+    _label_points = None
     if _violation_draw_handler is not None:
         try:
             bpy.types.SpaceView3D.draw_handler_remove(_violation_draw_handler, "WINDOW")
@@ -748,19 +1151,3 @@ def cleanup_validation_draw_handlers():
         except Exception:
             pass
         _violation_label_draw_handler = None
-    if _keyframe_points_draw_handler is not None:
-        try:
-            bpy.types.SpaceView3D.draw_handler_remove(
-                _keyframe_points_draw_handler, "WINDOW"
-            )
-        except Exception:
-            pass
-        _keyframe_points_draw_handler = None
-    if _floor_limit_draw_handler is not None:
-        try:
-            bpy.types.SpaceView3D.draw_handler_remove(
-                _floor_limit_draw_handler, "WINDOW"
-            )
-        except Exception:
-            pass
-        _floor_limit_draw_handler = None
@@ -7,6 +7,7 @@ existing Roblox rig, with optional bone creation for independent animation.
 
 import bpy
 from bpy_extras.io_utils import ImportHelper
+from mathutils import Vector
 from ..core.utils import (
     find_master_collection_for_object,
     find_parts_collection_in_master,
@@ -61,12 +62,15 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
+        # need at least one selected mesh; selected_objects is already
+        # filtered to the view layer's selection, and checking it first
+        # skips the armature lookup for the common empty-selection redraw
+        selected = context.selected_objects
+        if not selected or not any(obj.type == "MESH" for obj in selected):
+            return False
         settings = getattr(context.scene, "rbx_anim_settings", None)
         arm_name = settings.rbx_anim_armature if settings else None
-        if not object_exists(arm_name, context.scene):
-            return False
-        # need at least one selected mesh
-        return any(obj.type == "MESH" and obj.select_get() for obj in context.selected_objects)
+        return object_exists(arm_name, context.scene)
 
     def invoke(self, context, event):
         settings = getattr(context.scene, "rbx_anim_settings", None)
@@ -120,7 +124,8 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
             self.report({"ERROR"}, "No valid armature selected")
             return {"CANCELLED"}
         
-        if not self.bone_name or self.bone_name not in armature.data.bones:
+        bone = armature.data.bones.get(self.bone_name) if self.bone_name else None
+        if bone is None:
             self.report({"ERROR"}, f"Bone '{self.bone_name}' not found on armature")
             return {"CANCELLED"}
         
@@ -138,6 +143,7 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
             )
             if not target_bone_name:
                 return {"CANCELLED"}
+            bone = armature.data.bones[target_bone_name]
         
         # move meshes to parts collection if requested
         if self.move_to_parts:
@@ -145,10 +151,21 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
             parts_coll = find_parts_collection_in_master(master_coll, create_if_missing=True)
             if parts_coll:
                 for obj in meshes:
-                    # unlink from current collections, link to parts
+                    # unlink from every other collection, link to parts only
+                    # if not already there; each link/unlink rebuilds the
+                    # layer collections, so unchanged memberships are skipped
+                    in_parts = False
                     for coll in list(obj.users_collection):
-                        coll.objects.unlink(obj)
-                    parts_coll.objects.link(obj)
+                        if coll == parts_coll:
+                            in_parts = True
+                        else:
+                            coll.objects.unlink(obj)
+                    if not in_parts:
+                        parts_coll.objects.link(obj)
+        
+        # the inverse matrix only depends on the target bone, so it is
+        # computed once for every mesh
+        inverse_mat = (armature.matrix_world @ bone.matrix_local).inverted()
         
         # create CHILD_OF constraints
         attached = []
@@ -164,11 +181,7 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
             
             # set inverse matrix so the mesh stays at its current position
             # relative to the bone
-            bone = armature.data.bones[target_bone_name]
-            bone_mat = bone.matrix_local
-            if hasattr(bone_mat, "to_4x4"):
-                bone_mat = bone_mat.to_4x4()
-            constraint.inverse_matrix = (armature.matrix_world @ bone_mat).inverted()
+            constraint.inverse_matrix = inverse_mat
             
             attached.append(obj.name)
         
@@ -179,70 +192,105 @@ class OBJECT_OT_AttachMeshToBone(bpy.types.Operator):
     def _create_weapon_bone(self, context, armature, parent_bone_name, weapon_name, meshes):
         """Create a new child bone on the armature for the weapon.
         
-        The bone is positioned at the centroid of all weapon meshes.
+        The bone is positioned at the vertex-weighted centroid of all weapon
+        meshes (previously the mean of per-mesh bounding box centers), so
+        denser meshes pull the bone further. Meshes without vertices are
+        ignored unless none of the meshes have any, in which case the mean
+        of their origins is used.
         Returns the new bone's name, or None on failure.
         """
-        from mathutils import Vector
+        import numpy as np
         
-        # compute weapon centroid from all meshes
-        centers = []
+        # compute weapon centroid as the mean of all vertex positions across
+        # the meshes, in a single running sum. vertices go straight into
+        # armature space: the armature inverse is folded into each mesh's
+        # matrix, so the centroid is already the bone head
+        arm_inv = np.asarray(armature.matrix_world.inverted_safe(), dtype=np.float64)
+        sum_xyz = np.zeros(3, dtype=np.float64)
+        total = 0
+        origin_sum = np.zeros(3, dtype=np.float64)
+        origin_count = 0
+        # one fp32 coordinate buffer sized for the largest mesh, reused for
+        # every foreach_get instead of allocating per mesh
+        max_verts = max((len(obj.data.vertices) for obj in meshes), default=0)
+        co_buf = np.empty(max_verts * 3, dtype=np.float32)
         for obj in meshes:
-            if obj.data.vertices:
-                min_co = [float('inf')] * 3
-                max_co = [float('-inf')] * 3
-                for v in obj.data.vertices:
-                    world_co = obj.matrix_world @ v.co
-                    for i in range(3):
-                        min_co[i] = min(min_co[i], world_co[i])
-                        max_co[i] = max(max_co[i], world_co[i])
-                centers.append(Vector([(min_co[i] + max_co[i]) / 2.0 for i in range(3)]))
+            vertices = obj.data.vertices
+            mat = arm_inv @ np.asarray(obj.matrix_world, dtype=np.float64)
+            count = len(vertices)
+            if count:
+                co = co_buf[: count * 3]
+                vertices.foreach_get("co", co)
+                # the combined matrix is affine, so transforming the local sum is
+                # the same as summing the transformed vertices
+                local_sum = co.reshape(-1, 3).sum(axis=0, dtype=np.float64)
+                sum_xyz += mat[:3, :3] @ local_sum + mat[:3, 3] * count
+                total += count
             else:
-                centers.append(obj.matrix_world.to_translation())
+                # empty helper meshes only matter when nothing has geometry
+                origin_sum += mat[:3, 3]
+                origin_count += 1
         
-        if not centers:
+        if total:
+            centroid = Vector((sum_xyz / total).tolist())
+        elif origin_count:
+            centroid = Vector((origin_sum / origin_count).tolist())
+        else:
             self.report({"ERROR"}, "No valid mesh geometry for bone placement")
             return None
         
-        centroid = sum(centers, Vector((0, 0, 0))) / len(centers)
-        
         # switch to edit mode on the armature to add the bone
         prev_active = context.view_layer.objects.active
-        prev_mode = armature.mode if armature == context.view_layer.objects.active else None
+        prev_mode = armature.mode if armature == prev_active else None
+        # with temp_override the armature is only active for the mode_set
+        # calls, so the view layer's active object never has to be swapped
+        # and restored
+        use_override = hasattr(context, "temp_override")
+        
+        def set_mode(mode):
+            if use_override:
+                with context.temp_override(active_object=armature, object=armature):
+                    bpy.ops.object.mode_set(mode=mode)
+            else:
+                bpy.ops.object.mode_set(mode=mode)
         
-        context.view_layer.objects.active = armature
-        bpy.ops.object.mode_set(mode="EDIT")
+        if not use_override:
+            context.view_layer.objects.active = armature
+        if armature.mode != "EDIT":
+            set_mode("EDIT")
         
         try:
             edit_bones = armature.data.edit_bones
             
-            # ensure unique name
-            final_name = weapon_name
-            counter = 1
-            while final_name in edit_bones:
-                final_name = f"{weapon_name}.{counter:03d}"
-                counter += 1
-            
-            # create bone
-            new_bone = edit_bones.new(final_name)
-            new_bone.head = armature.matrix_world.inverted() @ centroid
+            # create bone; edit_bones.new() suffixes clashing names (".001")
+            # itself, so the final name is read back below
+            new_bone = edit_bones.new(weapon_name)
+            new_bone.head = centroid
             # tail offset — small extension along parent's direction or Y-up
             parent_ebone = edit_bones.get(parent_bone_name)
+            direction = None
             if parent_ebone:
                 new_bone.parent = parent_ebone
-                direction = (parent_ebone.tail - parent_ebone.head).normalized()
-                new_bone.tail = new_bone.head + direction * 0.3
-            else:
-                new_bone.tail = new_bone.head + Vector((0, 0, 0.3))
+                parent_vec = parent_ebone.tail - parent_ebone.head
+                # squared-length early-out: a degenerate parent would give a
+                # zero direction, and blender drops zero-length bones when
+                # leaving edit mode
+                if parent_vec.length_squared > 1e-12:
+                    direction = parent_vec.normalized()
+            if direction is None:
+                direction = Vector((0, 0, 1))
+            new_bone.tail = new_bone.head + direction * 0.3
             
             new_bone.use_deform = False
             
             created_name = new_bone.name  # blender may have changed it
         finally:
-            bpy.ops.object.mode_set(mode="OBJECT")
-            if prev_active:
+            # leaving edit mode writes the new bone into armature.data.bones
+            set_mode("OBJECT")
+            if prev_active and not use_override:
                 context.view_layer.objects.active = prev_active
-            if prev_mode and prev_active == armature:
-                bpy.ops.object.mode_set(mode=prev_mode)
+            if prev_mode and prev_mode != "OBJECT":
+                set_mode(prev_mode)
         
         return created_name
 
@@ -270,8 +318,9 @@ class OBJECT_OT_ImportAndAttach(bpy.types.Operator, ImportHelper):
         return object_exists(arm_name, context.scene)
 
     def execute(self, context):
-        # remember what's already in the scene
-        before = {obj.name for obj in context.scene.objects}
+        # remember what's already in the scene; as_pointer() is a plain int
+        # of the object's address, so no name strings are built or hashed
+        before = {obj.as_pointer() for obj in context.scene.objects}
         
         # import the OBJ
         if bpy.app.version >= (4, 0, 0):
@@ -288,7 +337,7 @@ class OBJECT_OT_ImportAndAttach(bpy.types.Operator, ImportHelper):
         # find newly imported meshes
         new_meshes = [
             obj for obj in context.scene.objects
-            if obj.name not in before and obj.type == "MESH"
+            if obj.type == "MESH" and obj.as_pointer() not in before
         ]
         
         if not new_meshes:
@@ -11,9 +11,12 @@ on individual bones, allowing per-rig customization without cluttering the UI.
 import bpy
 import gpu
 from gpu_extras.batch import batch_for_shader
-from mathutils import Vector
+from mathutils import Matrix, Vector
 from typing import Optional, Dict, Tuple
 
+from .ik import IK_HELPER_SUFFIXES
+from ..core.utils import pose_bone_select_getter
+
 # Default bone weights for R15 rigs
 DEFAULT_BONE_WEIGHTS_R15 = {
     "HumanoidRootPart": 0.0,
@@ -54,8 +57,25 @@ DEFAULT_WEIGHT = 0.05
 # Custom property name for storing bone weights
 COM_WEIGHT_PROP = "com_weight"
 
-# IK bone suffixes to skip in COM calculation
-_IK_SUFFIXES = ("-IKTarget", "-IKPole", "-IKStretch")
+
+class _NormalizeTable(dict):
+    """str.translate table: alphanumerics -> lowercase, everything else dropped.
+
+    Filled lazily per code point, so only characters that actually occur in
+    bone names are ever stored.
+    """
+
+    def __missing__(self, code: int):
+        ch = chr(code)
+        value = ch.lower() if ch.isalnum() else None
+        self[code] = value
+        return value
+
+
+_NORMALIZE_TABLE = _NormalizeTable()
+for _code in range(128):
+    _NORMALIZE_TABLE[_code]
+del _code
 
 
 def _normalize_name(s: str) -> str:
@@ -64,7 +84,42 @@ def _normalize_name(s: str) -> str:
     Removes non-alphanumeric characters and lowercases the string so we can
     compare 'Left Leg' with 'LeftLeg' or 'left_leg' reliably.
     """
-    return ''.join(ch.lower() for ch in (s or "") if ch.isalnum())
+    return (s or "").translate(_NORMALIZE_TABLE)
+
+
+def _sorted_normalized(weights: Dict[str, float]) -> Tuple[Tuple[str, float], ...]:
+    """(normalized_key, weight) pairs, longest key first, for partial matching."""
+    return tuple(
+        sorted(
+            ((_normalize_name(k), v) for k, v in weights.items()),
+            key=lambda kv: len(kv[0]),
+            reverse=True,
+        )
+    )
+
+
+# Partial-match tables, normalized and sorted once at import instead of on
+# every lookup. Longer (more specific) keys come first so e.g. 'lowertorso'
+# wins over 'torso' and R6 keys don't override R15 ones.
+_SORTED_DEFAULTS = _sorted_normalized(DEFAULT_BONE_WEIGHTS)
+_SORTED_R15 = _sorted_normalized(DEFAULT_BONE_WEIGHTS_R15)
+_SORTED_R6 = _sorted_normalized(DEFAULT_BONE_WEIGHTS_R6)
+
+# Exact-match lookups over the same normalized keys
+_NORMALIZED_R15 = dict(_SORTED_R15)
+_NORMALIZED_R6 = dict(_SORTED_R6)
+
+# Non-custom weight per bone name. It depends on nothing but the name and the
+# constant tables above, so it never needs invalidating; custom 'com_weight'
+# values are still read from the bone on every call.
+_DEFAULT_WEIGHT_BY_NAME: Dict[str, float] = {}
+
+
+# R15 markers (more specific names) and R6 markers, normalized
+_R15_MARKERS = frozenset(
+    ("lowertorso", "uppertorso", "leftupperarm", "rightupperarm", "leftupperleg", "rightupperleg")
+)
+_R6_MARKERS = frozenset(("torso", "leftarm", "rightarm", "leftleg", "rightleg"))
 
 
 def detect_rig_type(armature: "bpy.types.Object") -> str:
@@ -75,19 +130,17 @@ def detect_rig_type(armature: "bpy.types.Object") -> str:
     if not armature or armature.type != "ARMATURE":
         return "unknown"
 
-    names = { _normalize_name(b.name) for b in armature.data.bones }
-
-    # R15 markers (more specific names)
-    r15_markers = ("lowertorso", "uppertorso", "leftupperarm", "rightupperarm", "leftupperleg", "rightupperleg")
-    if any(m in names for m in r15_markers):
-        return "R15"
-
-    # R6 markers
-    r6_markers = ("torso", "leftarm", "rightarm", "leftleg", "rightleg")
-    if any(m in names for m in r6_markers):
-        return "R6"
+    # One pass over the bones; any R15 marker decides immediately, R6 only
+    # wins if no R15 marker turns up anywhere
+    found_r6 = False
+    for bone in armature.data.bones:
+        name = _normalize_name(bone.name)
+        if name in _R15_MARKERS:
+            return "R15"
+        if name in _R6_MARKERS:
+            found_r6 = True
 
-    return "unknown"
+    return "R6" if found_r6 else "unknown"
 
 
 def get_bone_weight(bone: "bpy.types.Bone") -> float:
@@ -107,23 +160,31 @@ def get_bone_weight(bone: "bpy.types.Bone") -> float:
         Weight value (0.0 to 1.0 typically, but can be any positive value).
     """
     # Check for custom weight property first
-    if COM_WEIGHT_PROP in bone:
-        return float(bone[COM_WEIGHT_PROP])
+    custom = bone.get(COM_WEIGHT_PROP)
+    if custom is not None:
+        return float(custom)
+
+    name = bone.name
+    weight = _DEFAULT_WEIGHT_BY_NAME.get(name)
+    if weight is None:
+        weight = _DEFAULT_WEIGHT_BY_NAME[name] = _default_weight_for_name(name)
+    return weight
+
 
+def _default_weight_for_name(name: str) -> float:
+    """Resolve the non-custom weight for a bone name (steps 2-5 of get_bone_weight)."""
     # Always default root-like bones to 0 (unless user explicitly set com_weight)
-    if "root" in bone.name.lower():
+    if "root" in name.lower():
         return 0.0
     
     # Check exact match in defaults
-    if bone.name in DEFAULT_BONE_WEIGHTS:
-        return DEFAULT_BONE_WEIGHTS[bone.name]
+    if name in DEFAULT_BONE_WEIGHTS:
+        return DEFAULT_BONE_WEIGHTS[name]
     
     # Check partial match using normalized names and prefer longer (more specific) keys
-    normalized_bone = _normalize_name(bone.name)
-    # Sort keys by length descending so specific keys (e.g., 'lower torso') are matched
-    # before generic ones (e.g., 'torso') to avoid R6->R15 overrides.
-    for key, weight in sorted(DEFAULT_BONE_WEIGHTS.items(), key=lambda kv: len(_normalize_name(kv[0])), reverse=True):
-        if _normalize_name(key) in normalized_bone:
+    normalized_bone = _normalize_name(name)
+    for key, weight in _SORTED_DEFAULTS:
+        if key in normalized_bone:
             return weight
     
     return DEFAULT_WEIGHT
@@ -142,6 +203,7 @@ def set_bone_weight(bone: "bpy.types.Bone", weight: float):
             del bone[COM_WEIGHT_PROP]
     else:
         bone[COM_WEIGHT_PROP] = weight
+    _invalidate_com_caches()
 
 
 def get_all_bone_weights(armature: "bpy.types.Object") -> Dict[str, Tuple[float, bool]]:
@@ -177,6 +239,7 @@ def clear_all_custom_weights(armature: "bpy.types.Object"):
     for bone in armature.data.bones:
         if COM_WEIGHT_PROP in bone:
             del bone[COM_WEIGHT_PROP]
+    _invalidate_com_caches()
 
 
 def apply_default_weights(armature: "bpy.types.Object", overwrite: bool = False) -> int:
@@ -202,13 +265,12 @@ def apply_default_weights(armature: "bpy.types.Object", overwrite: bool = False)
     if rig_type == "unknown" and not overwrite:
         return 0
 
-    # Select mapping based on rig type
+    # Select mapping based on rig type (R15 is also the fallback); both
+    # tables are normalized once at import
     if rig_type == "R6":
-        # Use normalized keys for matching
-        mapping = { _normalize_name(k): v for k, v in DEFAULT_BONE_WEIGHTS_R6.items() }
+        sorted_mapping, mapping = _SORTED_R6, _NORMALIZED_R6
     else:
-        # R15 or fallback: use the R15 mapping
-        mapping = { _normalize_name(k): v for k, v in DEFAULT_BONE_WEIGHTS_R15.items() }
+        sorted_mapping, mapping = _SORTED_R15, _NORMALIZED_R15
 
     applied = 0
 
@@ -231,7 +293,7 @@ def apply_default_weights(armature: "bpy.types.Object", overwrite: bool = False)
             weight = mapping[norm_name]
         else:
             # Partial match: prefer longer/more specific keys
-            for key, w in sorted(mapping.items(), key=lambda kv: len(kv[0]), reverse=True):
+            for key, w in sorted_mapping:
                 if key in norm_name:
                     weight = w
                     break
@@ -245,9 +307,31 @@ def apply_default_weights(armature: "bpy.types.Object", overwrite: bool = False)
             bone[COM_WEIGHT_PROP] = weight
             applied += 1
 
+    if applied:
+        _invalidate_com_caches()
     return applied
 
 
+def _com_weights(pose_bones) -> "np.ndarray":
+    """Per-bone COM weights in pose.bones order.
+
+    IK helper bones and zero/negative weights stay at 0.
+    """
+    import numpy as np
+    
+    weights = np.zeros(len(pose_bones), dtype=np.float64)
+    for i, pose_bone in enumerate(pose_bones):
+        # Skip IK helper bones
+        if pose_bone.name.endswith(IK_HELPER_SUFFIXES):
+            continue
+        
+        # Get bone weight (custom or default)
+        weight = get_bone_weight(pose_bone.bone)
+        if weight > 0:
+            weights[i] = weight
+    return weights
+
+
 def calculate_com(armature: "bpy.types.Object") -> Vector:
     """Calculate the center of mass for an armature using bone weights.
     
@@ -263,36 +347,28 @@ def calculate_com(armature: "bpy.types.Object") -> Vector:
     if not armature or armature.type != "ARMATURE":
         return Vector((0, 0, 0))
     
-    total_weight = 0.0
-    weighted_position = Vector((0, 0, 0))
+    import numpy as np
     
-    # Cache the matrix for all bones
-    matrix_world = armature.matrix_world
+    pose_bones = armature.pose.bones
+    count = len(pose_bones)
     
-    for pose_bone in armature.pose.bones:
-        # Skip IK helper bones
-        bone_name = pose_bone.name
-        if any(bone_name.endswith(suffix) for suffix in _IK_SUFFIXES):
-            continue
-        
-        # Get bone weight (custom or default)
-        weight = get_bone_weight(pose_bone.bone)
-        
-        # Skip bones with zero weight
-        if weight <= 0:
-            continue
-        
-        # Get bone center position in world space
-        # Use head + (tail - head) * 0.5 for center
-        bone_center = matrix_world @ ((pose_bone.head + pose_bone.tail) * 0.5)
-        
-        weighted_position += bone_center * weight
-        total_weight += weight
+    weights = _com_weights(pose_bones)
+    total_weight = weights.sum()
+    if total_weight <= 0:
+        return armature.location.copy()
     
-    if total_weight > 0:
-        return weighted_position / total_weight
+    # bone centers (head + tail) * 0.5 in armature space, fetched in bulk
+    heads = np.empty(count * 3, dtype=np.float32)
+    tails = np.empty(count * 3, dtype=np.float32)
+    pose_bones.foreach_get("head", heads)
+    pose_bones.foreach_get("tail", tails)
+    centers = (heads.reshape(count, 3) + tails.reshape(count, 3)) * 0.5
     
-    return armature.location.copy()
+    # weighted centroid without materializing weights[:, None] * centers;
+    # matrix_world is affine and the weights are normalized, so one
+    # transform of the local centroid equals averaging world-space centers
+    local_com = np.einsum("b,bj->j", weights, centers) / total_weight
+    return armature.matrix_world @ Vector(local_com.tolist())
 
 
 def calculate_com_velocity(
@@ -312,27 +388,24 @@ def calculate_com_velocity(
     Returns:
         Velocity vector (units per second).
     """
+    frame_delta = abs(frame_current - frame_prev)
+    if frame_delta == 0:
+        return Vector((0, 0, 0))
+    
     scene = bpy.context.scene
     original_frame = scene.frame_current
     
-    # Get COM at previous frame
+    # frame_set re-evaluates the action even on the current frame, so
+    # unkeyed pose edits never leak into either COM; it also updates the
+    # depsgraph, no separate view_layer.update() is needed
     scene.frame_set(frame_prev)
-    bpy.context.view_layer.update()
     com_prev = calculate_com(armature)
-    
-    # Get COM at current frame
     scene.frame_set(frame_current)
-    bpy.context.view_layer.update()
     com_current = calculate_com(armature)
     
     # Restore original frame
     scene.frame_set(original_frame)
     
-    # Calculate velocity
-    frame_delta = abs(frame_current - frame_prev)
-    if frame_delta == 0:
-        return Vector((0, 0, 0))
-    
     time_delta = frame_delta / fps
     velocity = (com_current - com_prev) / time_delta
     
@@ -341,81 +414,128 @@ def calculate_com_velocity(
 
 # Global state for COM visualization
 _com_draw_handler = None
-_com_data = {
-    "enabled": False,
-    "armature_name": None,  # Track which armature the COM is for
-    "position": Vector((0, 0, 0)),
-    "show_projection": True,
-    "show_grid": True,  # Circular grid at ground level
-    "grid_radius": 1.0,  # Radius of the circular grid
-    "grid_rings": 3,  # Number of concentric rings
-    "projection_z": 0.0,
-    "color": (1.0, 0.8, 0.0, 1.0),  # Yellow
-    "projection_color": (0.0, 0.8, 1.0, 0.5),  # Cyan, semi-transparent
-    "grid_color": (0.5, 0.5, 0.5, 0.3),  # Gray, semi-transparent
-    "size": 0.15,
-}
+class _COMState:
+    """Visualization state read by the draw callback on every redraw.
+
+    Slots instead of a dict so each read is an attribute load rather than a
+    string-keyed lookup.
+    """
+
+    __slots__ = (
+        "enabled", "armature_name", "position", "show_projection", "show_grid",
+        "grid_radius", "grid_rings", "projection_z", "color", "projection_color",
+        "grid_color", "size",
+    )
+
+    def __init__(self):
+        self.enabled = False
+        self.armature_name = None  # Track which armature the COM is for
+        self.position = Vector((0, 0, 0))
+        self.show_projection = True
+        self.show_grid = True  # Circular grid at ground level
+        self.grid_radius = 1.0  # Radius of the circular grid
+        self.grid_rings = 3  # Number of concentric rings
+        self.projection_z = 0.0
+        self.color = (1.0, 0.8, 0.0, 1.0)  # Yellow
+        self.projection_color = (0.0, 0.8, 1.0, 0.5)  # Cyan, semi-transparent
+        self.grid_color = (0.5, 0.5, 0.5, 0.3)  # Gray, semi-transparent
+        self.size = 0.15
+
+
+_com_state = _COMState()
+
+
+# builtin shader resolved on first draw and reused by every redraw after
+_com_shader = None
 
 
 def _get_com_shader():
-    try:
-        return gpu.shader.from_builtin('UNIFORM_COLOR')
-    except Exception:
-        return gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    global _com_shader
+    if _com_shader is None:
+        try:
+            _com_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        except Exception:
+            _com_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    return _com_shader
+
+
+# closed unit circles for LINE_STRIP, keyed by segment count; built on first
+# draw and only scaled/translated afterwards
+_unit_circle_cache: Dict[int, "np.ndarray"] = {}
+
+
+def _unit_circle(segments: int) -> "np.ndarray":
+    """(segments + 1, 2) float32 cos/sin points starting and ending at angle 0.
+
+    drawn as LINE_STRIP rather than LINE_LOOP, which the newer gpu backends
+    deprecate; the repeated end point closes the circle.
+    """
+    import numpy as np
+
+    circle = _unit_circle_cache.get(segments)
+    if circle is None:
+        theta = np.linspace(0.0, 2.0 * np.pi, segments + 1)
+        circle = np.stack((np.cos(theta), np.sin(theta)), axis=1).astype(np.float32)
+        _unit_circle_cache[segments] = circle
+    return circle
+
+
+def _flat_points(xy: "np.ndarray", z: float) -> "np.ndarray":
+    """lift (K, 2) xy points onto the plane at height z as (K, 3) float32."""
+    import numpy as np
+
+    out = np.empty((len(xy), 3), dtype=np.float32)
+    out[:, :2] = xy
+    out[:, 2] = z
+    return out
+
+
+def _tag_view3d_redraw():
+    """Tag every 3D viewport of the active screen for redraw."""
+    screen = bpy.context.screen
+    if screen is None:
+        # frame/depsgraph handlers can run without a screen (e.g. rendering)
+        return
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
 
 
 def _draw_com_callback():
     """OpenGL callback to draw the COM indicator."""
-    if not _com_data["enabled"]:
+    if not _com_state.enabled:
         return
     
     # Only draw if the tracked armature still exists and is valid
-    armature_name = _com_data.get("armature_name")
+    armature_name = _com_state.armature_name
     if armature_name:
         armature = bpy.data.objects.get(armature_name)
         if not armature or armature.type != "ARMATURE":
             # Armature was deleted or renamed, disable visualization
-            _com_data["enabled"] = False
+            _com_state.enabled = False
             return
     
-    pos = _com_data["position"]
-    size = _com_data["size"]
-    color = _com_data["color"]
+    import numpy as np
+    
+    pos = _com_state.position
+    size = _com_state.size
+    color = _com_state.color
+    center = np.array((pos.x, pos.y, pos.z), dtype=np.float32)
+    center_xy = center[:2]
     
     shader = _get_com_shader()
     
     # Draw COM sphere (approximated with lines)
-    vertices = []
-    
-    # Create a simple cross/star pattern for the COM
-    # X axis
-    vertices.extend([
-        (pos.x - size, pos.y, pos.z),
-        (pos.x + size, pos.y, pos.z),
-    ])
-    # Y axis
-    vertices.extend([
-        (pos.x, pos.y - size, pos.z),
-        (pos.x, pos.y + size, pos.z),
-    ])
-    # Z axis
-    vertices.extend([
-        (pos.x, pos.y, pos.z - size),
-        (pos.x, pos.y, pos.z + size),
-    ])
+    # Create a simple cross/star pattern for the COM: one +/- pair per axis
+    axes = np.repeat(np.eye(3, dtype=np.float32), 2, axis=0)
+    axes[0::2] *= -1.0
+    cross = center + axes * size
     
     # Draw circle in XY plane
-    import math
-    segments = 16
-    for i in range(segments):
-        angle1 = (i / segments) * 2 * math.pi
-        angle2 = ((i + 1) / segments) * 2 * math.pi
-        vertices.extend([
-            (pos.x + math.cos(angle1) * size * 0.7, pos.y + math.sin(angle1) * size * 0.7, pos.z),
-            (pos.x + math.cos(angle2) * size * 0.7, pos.y + math.sin(angle2) * size * 0.7, pos.z),
-        ])
-    
-    batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
+    circle = _flat_points(_unit_circle(16) * (size * 0.7) + center_xy, pos.z)
+    
+    batch = batch_for_shader(shader, 'LINES', {"pos": cross})
+    batch_circle = batch_for_shader(shader, 'LINE_STRIP', {"pos": circle})
     
     shader.bind()
     shader.uniform_float("color", color)
@@ -423,25 +543,26 @@ def _draw_com_callback():
     gpu.state.line_width_set(2.0)
     gpu.state.blend_set('ALPHA')
     batch.draw(shader)
+    batch_circle.draw(shader)
     
     # Draw projection line to ground
-    if _com_data["show_projection"]:
-        proj_z = _com_data["projection_z"]
-        proj_color = _com_data["projection_color"]
+    if _com_state.show_projection:
+        proj_z = _com_state.projection_z
+        proj_color = _com_state.projection_color
         
-        proj_vertices = [
-            (pos.x, pos.y, pos.z),
-            (pos.x, pos.y, proj_z),
-        ]
-        
-        # Draw projection point (small cross on ground)
+        # vertical line, then a small cross on the ground
         cross_size = size * 0.5
-        proj_vertices.extend([
-            (pos.x - cross_size, pos.y, proj_z),
-            (pos.x + cross_size, pos.y, proj_z),
-            (pos.x, pos.y - cross_size, proj_z),
-            (pos.x, pos.y + cross_size, proj_z),
-        ])
+        proj_vertices = np.array(
+            (
+                (pos.x, pos.y, pos.z),
+                (pos.x, pos.y, proj_z),
+                (pos.x - cross_size, pos.y, proj_z),
+                (pos.x + cross_size, pos.y, proj_z),
+                (pos.x, pos.y - cross_size, proj_z),
+                (pos.x, pos.y + cross_size, proj_z),
+            ),
+            dtype=np.float32,
+        )
         
         batch_proj = batch_for_shader(shader, 'LINES', {"pos": proj_vertices})
         shader.uniform_float("color", proj_color)
@@ -449,46 +570,37 @@ def _draw_com_callback():
         batch_proj.draw(shader)
     
     # Draw circular grid at ground level
-    if _com_data["show_grid"]:
-        proj_z = _com_data["projection_z"]
-        grid_color = _com_data["grid_color"]
-        grid_radius = _com_data["grid_radius"]
-        grid_rings = _com_data["grid_rings"]
-        
-        grid_vertices = []
-        segments = 32  # Segments per circle
-        
-        # Draw concentric rings centered on COM projection
-        for ring in range(1, grid_rings + 1):
-            ring_radius = (ring / grid_rings) * grid_radius
-            for i in range(segments):
-                angle1 = (i / segments) * 2 * math.pi
-                angle2 = ((i + 1) / segments) * 2 * math.pi
-                grid_vertices.extend([
-                    (pos.x + math.cos(angle1) * ring_radius, pos.y + math.sin(angle1) * ring_radius, proj_z),
-                    (pos.x + math.cos(angle2) * ring_radius, pos.y + math.sin(angle2) * ring_radius, proj_z),
-                ])
+    if _com_state.show_grid:
+        proj_z = _com_state.projection_z
+        grid_color = _com_state.grid_color
+        grid_radius = _com_state.grid_radius
+        grid_rings = _com_state.grid_rings
         
-        # Draw cross lines through center
-        grid_vertices.extend([
-            (pos.x - grid_radius, pos.y, proj_z),
-            (pos.x + grid_radius, pos.y, proj_z),
-            (pos.x, pos.y - grid_radius, proj_z),
-            (pos.x, pos.y + grid_radius, proj_z),
-        ])
+        # Draw concentric rings centered on COM projection (32 segments each)
+        # as one strip: every ring starts and ends on the +X spoke, so the
+        # hop from one ring to the next runs along a line that is drawn anyway
+        radii = np.arange(1, grid_rings + 1, dtype=np.float32) * (grid_radius / grid_rings)
+        rings = _unit_circle(32)[None, :, :] * radii[:, None, None] + center_xy
         
-        # Draw diagonal lines
+        # Draw cross lines and diagonals through center
         diag = grid_radius * 0.707  # cos(45°)
-        grid_vertices.extend([
-            (pos.x - diag, pos.y - diag, proj_z),
-            (pos.x + diag, pos.y + diag, proj_z),
-            (pos.x - diag, pos.y + diag, proj_z),
-            (pos.x + diag, pos.y - diag, proj_z),
-        ])
+        spokes = np.array(
+            (
+                (-grid_radius, 0.0), (grid_radius, 0.0),
+                (0.0, -grid_radius), (0.0, grid_radius),
+                (-diag, -diag), (diag, diag),
+                (-diag, diag), (diag, -diag),
+            ),
+            dtype=np.float32,
+        ) + center_xy
         
-        batch_grid = batch_for_shader(shader, 'LINES', {"pos": grid_vertices})
+        batch_rings = batch_for_shader(
+            shader, 'LINE_STRIP', {"pos": _flat_points(rings.reshape(-1, 2), proj_z)}
+        )
+        batch_grid = batch_for_shader(shader, 'LINES', {"pos": _flat_points(spokes, proj_z)})
         shader.uniform_float("color", grid_color)
         gpu.state.line_width_set(1.0)
+        batch_rings.draw(shader)
         batch_grid.draw(shader)
     
     gpu.state.blend_set('NONE')
@@ -499,7 +611,7 @@ def enable_com_visualization(enable: bool = True):
     """Enable or disable COM visualization in the viewport."""
     global _com_draw_handler
     
-    _com_data["enabled"] = enable
+    _com_state.enabled = enable
     
     if enable and _com_draw_handler is None:
         _com_draw_handler = bpy.types.SpaceView3D.draw_handler_add(
@@ -509,17 +621,52 @@ def enable_com_visualization(enable: bool = True):
         bpy.types.SpaceView3D.draw_handler_remove(_com_draw_handler, 'WINDOW')
         _com_draw_handler = None
         # Clear armature tracking when disabled
-        _com_data["armature_name"] = None
+        _com_state.armature_name = None
     
     # Redraw viewports
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    _tag_view3d_redraw()
+
+
+# armature data pointer -> (bone count, indices of foot pose bones).
+# Cleared by _invalidate_com_caches, so bone renames are picked up.
+_foot_index_cache: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+
+
+def _foot_bone_indices(armature: "bpy.types.Object") -> Tuple[int, ...]:
+    """Indices of pose bones with 'foot' in their name, cached per armature.
+
+    The cached entry is reused until the depsgraph handler clears it (any
+    edit, including a bone rename) or the bone count changes, so the
+    per-frame update only touches the foot bones instead of lowercasing
+    every bone name.
+    """
+    pose_bones = armature.pose.bones
+    count = len(pose_bones)
+    key = armature.data.as_pointer()
+    cached = _foot_index_cache.get(key)
+    if cached is not None and cached[0] == count:
+        return cached[1]
+    indices = tuple(i for i, pb in enumerate(pose_bones) if "foot" in pb.name.lower())
+    _foot_index_cache[key] = (count, indices)
+    return indices
+
+
+# (armature pointer, frame) -> (COM, projection z) for update_com_visualization.
+# Cleared by _invalidate_com_caches.
+_COM_MEMO: Dict[Tuple[int, float], Tuple[Vector, float]] = {}
+_COM_MEMO_SIZE = 4
+
+
+def _invalidate_com_caches():
+    """Forget every cached COM and foot index; called whenever poses,
+    weights or bone names may change."""
+    _COM_MEMO.clear()
+    _foot_index_cache.clear()
 
 
 def update_com_visualization(armature: "bpy.types.Object"):
     """Update the COM visualization position."""
-    if not _com_data["enabled"]:
+    if not _com_state.enabled:
         return
     
     # Check if armature is valid
@@ -527,24 +674,30 @@ def update_com_visualization(armature: "bpy.types.Object"):
         return
     
     # Track which armature we're visualizing
-    _com_data["armature_name"] = armature.name
+    _com_state.armature_name = armature.name
     
-    com = calculate_com(armature)
-    _com_data["position"] = com
-    
-    # Update projection Z to be at the lowest foot position or 0
-    min_z = 0.0
-    for pose_bone in armature.pose.bones:
-        if "foot" in pose_bone.name.lower():
-            foot_pos = armature.matrix_world @ pose_bone.head
+    # Revisited frames (scrubbing, looping playback) reuse the last result
+    key = (armature.as_pointer(), bpy.context.scene.frame_current_final)
+    memo = _COM_MEMO.get(key)
+    if memo is None:
+        com = calculate_com(armature)
+        
+        # Update projection Z to be at the lowest foot position or 0
+        min_z = 0.0
+        pose_bones = armature.pose.bones
+        matrix_world = armature.matrix_world
+        for i in _foot_bone_indices(armature):
+            foot_pos = matrix_world @ pose_bones[i].head
             min_z = min(min_z, foot_pos.z)
+        
+        memo = _COM_MEMO[key] = (com, min_z)
+        while len(_COM_MEMO) > _COM_MEMO_SIZE:
+            del _COM_MEMO[next(iter(_COM_MEMO))]
     
-    _com_data["projection_z"] = min_z
+    _com_state.position, _com_state.projection_z = memo
     
     # Redraw
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    _tag_view3d_redraw()
 
 
 def get_com_armature_name() -> Optional[str]:
@@ -553,7 +706,7 @@ def get_com_armature_name() -> Optional[str]:
     Returns:
         Armature name or None if no visualization is active.
     """
-    return _com_data.get("armature_name")
+    return _com_state.armature_name
 
 
 def is_com_for_armature(armature: "bpy.types.Object") -> bool:
@@ -565,19 +718,19 @@ def is_com_for_armature(armature: "bpy.types.Object") -> bool:
     Returns:
         True if COM is enabled and tracking this armature.
     """
-    if not _com_data["enabled"] or not armature:
+    if not _com_state.enabled or not armature:
         return False
-    return _com_data.get("armature_name") == armature.name
+    return _com_state.armature_name == armature.name
 
 
 def is_com_visualization_enabled() -> bool:
     """Check if COM visualization is enabled."""
-    return _com_data["enabled"]
+    return _com_state.enabled
 
 
 def is_com_grid_enabled() -> bool:
     """Check if COM circular grid is enabled."""
-    return _com_data["show_grid"]
+    return _com_state.show_grid
 
 
 def toggle_com_grid(enable: Optional[bool] = None):
@@ -587,14 +740,12 @@ def toggle_com_grid(enable: Optional[bool] = None):
         enable: If provided, set grid to this state. If None, toggle.
     """
     if enable is None:
-        _com_data["show_grid"] = not _com_data["show_grid"]
+        _com_state.show_grid = not _com_state.show_grid
     else:
-        _com_data["show_grid"] = enable
+        _com_state.show_grid = enable
     
     # Redraw viewports
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    _tag_view3d_redraw()
 
 
 def set_com_grid_radius(radius: float):
@@ -603,17 +754,15 @@ def set_com_grid_radius(radius: float):
     Args:
         radius: Grid radius in Blender units.
     """
-    _com_data["grid_radius"] = max(0.1, radius)
+    _com_state.grid_radius = max(0.1, radius)
     
     # Redraw viewports
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    _tag_view3d_redraw()
 
 
 def get_com_grid_radius() -> float:
     """Get the current grid radius."""
-    return _com_data["grid_radius"]
+    return _com_state.grid_radius
 
 
 
@@ -623,41 +772,53 @@ def rotate_around_com(
     axis: str,
     angle: float
 ):
-    """Rotate the armature around its center of mass.
+    """Rotate the armature's pose around its center of mass.
+    
+    Like transform.rotate in pose mode, the topmost selected pose bones are
+    rotated (children follow); with nothing selected the root bones are.
+    The object transform itself is left alone, so the result can be keyed.
     
     Args:
         armature: The armature object.
-        axis: Rotation axis ('X', 'Y', or 'Z').
+        axis: Rotation axis ('X', 'Y', or 'Z'), in world space.
         angle: Rotation angle in radians.
     """
     
     # Calculate COM
     com = calculate_com(armature)
     
-    # Store original cursor location and pivot
-    original_cursor = bpy.context.scene.cursor.location.copy()
-    original_pivot = bpy.context.scene.tool_settings.transform_pivot_point
-    
-    # Set cursor to COM and use cursor as pivot
-    bpy.context.scene.cursor.location = com
-    bpy.context.scene.tool_settings.transform_pivot_point = 'CURSOR'
-    
-    # Select armature and rotate
-    bpy.context.view_layer.objects.active = armature
-    armature.select_set(True)
-    
-    # Apply rotation
-    bpy.ops.transform.rotate(value=angle, orient_axis=axis, center_override=com)
+    # World-space rotation about the COM, expressed in armature space so it
+    # can be applied to pose matrices
+    rotation = (
+        Matrix.Translation(com) @ Matrix.Rotation(angle, 4, axis)
+        @ Matrix.Translation(-com)
+    )
+    local_rotation = armature.matrix_world.inverted() @ rotation @ armature.matrix_world
+    
+    is_selected = pose_bone_select_getter()
+    selected = {pb.name for pb in armature.pose.bones if is_selected(pb)}
+    targets = []
+    for pose_bone in armature.pose.bones:
+        if selected:
+            if pose_bone.name not in selected:
+                continue
+            # a selected ancestor already carries this bone
+            if any(parent.name in selected for parent in pose_bone.parent_recursive):
+                continue
+        elif pose_bone.parent is not None:
+            continue
+        targets.append(pose_bone)
     
-    # Restore original cursor and pivot
-    bpy.context.scene.cursor.location = original_cursor
-    bpy.context.scene.tool_settings.transform_pivot_point = original_pivot
+    # Read every matrix first; none of the targets parent each other
+    new_matrices = [local_rotation @ pose_bone.matrix for pose_bone in targets]
+    for pose_bone, matrix in zip(targets, new_matrices):
+        pose_bone.matrix = matrix
 
 
 # Frame change handler for real-time COM updates
 def _frame_change_handler(scene):
     """Update COM visualization when frame changes."""
-    if not _com_data["enabled"]:
+    if not _com_state.enabled:
         return
     
     # Find active armature
@@ -668,10 +829,13 @@ def _frame_change_handler(scene):
 
 def _depsgraph_update_handler(scene, depsgraph):
     """Update COM visualization on depsgraph changes (e.g., weight edits)."""
-    if not _com_data["enabled"]:
+    # any edit may change the pose or weights behind cached COMs
+    _invalidate_com_caches()
+
+    if not _com_state.enabled:
         return
 
-    armature_name = _com_data.get("armature_name")
+    armature_name = _com_state.armature_name
     obj = bpy.data.objects.get(armature_name) if armature_name else None
     if obj is None:
         obj = bpy.context.active_object
@@ -688,8 +852,11 @@ def register_frame_handler():
 
 def unregister_frame_handler():
     """Unregister the frame change handler."""
+    global _com_shader
     if _frame_change_handler in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.remove(_frame_change_handler)
+    # drop the cached shader so a reloaded addon resolves a fresh one
+    _com_shader = None
 
 
 def register_depsgraph_handler():
@@ -702,3 +869,4 @@ def unregister_depsgraph_handler():
     """Unregister the depsgraph update handler."""
     if _depsgraph_update_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_update_handler)
+    _invalidate_com_caches()
@@ -2,7 +2,8 @@
 Constraint management utilities for linking objects to bones.
 """
 
-import re
+import bpy
+
 from ..core.utils import (
     find_master_collection_for_object,
     find_parts_collection_in_master,
@@ -10,8 +11,21 @@ from ..core.utils import (
 )
 
 
-def link_object_to_bone_rigid(obj, ao, bone):
-    """Link an object to a bone with rigid transformation"""
+def _strip_numeric_suffix(name):
+    """Drop a trailing blender duplicate suffix such as '.001' (a dot followed only by digits)."""
+    dot = name.rfind(".")
+    if dot != -1 and name[dot + 1:].isdigit():
+        return name[:dot]
+    return name
+
+
+def link_object_to_bone_rigid(obj, ao, bone, armature_matrix=None, inverse_matrix=None):
+    """Link an object to a bone with rigid transformation.
+
+    Bulk callers can pass armature_matrix (a copy of ao.matrix_world) to
+    avoid reading it back from the armature for every object, or the
+    already inverted world bone matrix as inverse_matrix.
+    """
     # remove existing
     for constraint in [c for c in obj.constraints if c.type == "CHILD_OF"]:
         obj.constraints.remove(constraint)
@@ -20,12 +34,17 @@ def link_object_to_bone_rigid(obj, ao, bone):
     constraint = obj.constraints.new(type="CHILD_OF")
     constraint.target = ao
     constraint.subtarget = bone.name
+    if inverse_matrix is not None:
+        constraint.inverse_matrix = inverse_matrix
+        return
     bone_mat = getattr(bone, "matrix_local", None)
     if bone_mat is None:
         bone_mat = bone.matrix
     if hasattr(bone_mat, "to_4x4"):
         bone_mat = bone_mat.to_4x4()
-    constraint.inverse_matrix = (ao.matrix_world @ bone_mat).inverted()
+    if armature_matrix is None:
+        armature_matrix = ao.matrix_world
+    constraint.inverse_matrix = (armature_matrix @ bone_mat).inverted()
 
 
 def auto_constraint_parts(armature_name, skip_objects=None):
@@ -65,17 +84,34 @@ def auto_constraint_parts(armature_name, skip_objects=None):
     # This handles duplicates correctly (e.g. "left hand", "left hand.001")
     from collections import defaultdict
     bone_groups = defaultdict(list)  # base_name_lower -> [bone_name, ...]
-    for bone in armature.data.bones:
-        base = re.sub(r"\.\d+$", "", bone.name).lower()
-        bone_groups[base].append(bone.name)
+    bone_index = {}  # bone_name -> index in armature.data.bones
+    for i, bone in enumerate(armature.data.bones):
+        name = bone.name
+        bone_groups[_strip_numeric_suffix(name).lower()].append(name)
+        bone_index[name] = i
     
-    # Precompute bone head positions in world space for disambiguation
-    bone_positions = {}
-    for bone in armature.data.bones:
-        bone_positions[bone.name] = armature.matrix_world @ bone.head_local
+    # World-space bone heads are only needed to disambiguate duplicate base
+    # names; on first use all of them are fetched and transformed in one batch.
+    # That is also the only place needing evaluated transforms/bounds, so the
+    # view layer is brought up to date there instead of on every call.
+    world_heads = None
+
+    def _world_heads():
+        nonlocal world_heads
+        if world_heads is None:
+            import numpy as np
+            bpy.context.view_layer.update()
+            bones = armature.data.bones
+            heads = np.empty(len(bones) * 3, dtype=np.float32)
+            bones.foreach_get("head_local", heads)
+            mat = np.asarray(armature.matrix_world, dtype=np.float64)
+            world_heads = heads.reshape(-1, 3) @ mat[:3, :3].T + mat[:3, 3]
+        return world_heads
     
     matched_parts = []
     used_bones = set()  # track which specific bones have been claimed
+    # plain int compare instead of bpy_struct __eq__ in the constraint scans
+    armature_ptr = armature.as_pointer()
 
     # Only process objects within this rig's parts collection
     for obj in parts_collection.objects:
@@ -85,57 +121,88 @@ def auto_constraint_parts(armature_name, skip_objects=None):
                 continue
                 
             # Strip .001, .002 etc from name for matching
-            base_name = re.sub(r"\.\d+$", "", obj.name).lower()
+            base_name = _strip_numeric_suffix(obj.name).lower()
             bone_candidates = bone_groups.get(base_name)
             if not bone_candidates:
                 continue
             
-            # Filter out already-claimed bones
-            available = [b for b in bone_candidates if b not in used_bones]
-            if not available:
-                continue
-            
-            # Pick the best bone: closest to the mesh's world center
-            if len(available) == 1:
-                bone_name = available[0]
+            # Most parts have a single bone per base name; only a claimed
+            # check is needed there, no filtered copy of the candidates
+            if len(bone_candidates) == 1:
+                bone_name = bone_candidates[0]
+                if bone_name in used_bones:
+                    continue
             else:
-                # Compute mesh center
-                mesh_center = obj.matrix_world.to_translation()  # rough center
-                if obj.data.vertices:
+                # Filter out already-claimed bones
+                available = [b for b in bone_candidates if b not in used_bones]
+                if not available:
+                    continue
+                
+                # Pick the best bone: closest to the mesh's world center
+                if len(available) == 1:
+                    bone_name = available[0]
+                else:
+                    import numpy as np
                     from mathutils import Vector
+                    
+                    # first, so the view layer update inside happens before
+                    # any matrix_world / bound_box read below
+                    heads = _world_heads()
+                
+                    # Compute mesh center (bounding box center of the vertices)
+                    mesh_center = obj.matrix_world.to_translation()  # rough center
                     verts = obj.data.vertices
-                    min_co = [float('inf')] * 3
-                    max_co = [float('-inf')] * 3
-                    for v in verts:
-                        for i in range(3):
-                            min_co[i] = min(min_co[i], v.co[i])
-                            max_co[i] = max(max_co[i], v.co[i])
-                    local_center = Vector([(min_co[i] + max_co[i]) / 2.0 for i in range(3)])
-                    mesh_center = obj.matrix_world @ local_center
+                    if verts:
+                        if not obj.modifiers and not obj.data.shape_keys:
+                            # bound_box is the evaluated local AABB; without
+                            # modifiers or shape keys it matches the vertex
+                            # bounds, and corners 0 and 6 are opposite
+                            bb = obj.bound_box
+                            lo, hi = bb[0], bb[6]
+                            local_center = Vector((
+                                (lo[0] + hi[0]) * 0.5,
+                                (lo[1] + hi[1]) * 0.5,
+                                (lo[2] + hi[2]) * 0.5,
+                            ))
+                        else:
+                            co = np.empty(len(verts) * 3, dtype=np.float32)
+                            verts.foreach_get("co", co)
+                            co = co.reshape(-1, 3)
+                            local_center = Vector(((co.min(axis=0) + co.max(axis=0)) * 0.5).tolist())
+                        mesh_center = obj.matrix_world @ local_center
                 
-                # Sort by distance to mesh center
-                def _bone_dist(bn):
-                    return (bone_positions[bn] - mesh_center).length
-                available.sort(key=_bone_dist)
-                bone_name = available[0]
+                    # Closest bone to the mesh center; argmin keeps the first of
+                    # equal distances, like the stable sort it replaces
+                    idx = [bone_index[bn] for bn in available]
+                    dists = np.linalg.norm(heads[idx] - np.asarray(mesh_center), axis=1)
+                    bone_name = available[int(np.argmin(dists))]
 
             used_bones.add(bone_name)
 
-            # Ensure exactly one correct Child Of constraint exists
-            correct_constraint_found = False
-            
-            for c in list(obj.constraints):
-                if c.type == "CHILD_OF":
-                    is_correct_target = (c.target == armature)
-                    is_correct_bone = (c.subtarget == bone_name)
-                    
-                    if is_correct_target and is_correct_bone and not correct_constraint_found:
-                        correct_constraint_found = True
-                    else:
-                        obj.constraints.remove(c)
+            # Ensure exactly one correct Child Of constraint exists.
+            # Single pass from the end so removals never shift the indices
+            # still to be visited; the earliest correct constraint wins, as
+            # it did before, so its inverse matrix is preserved.
+            constraints = obj.constraints
+            kept = None
+            for i in range(len(constraints) - 1, -1, -1):
+                c = constraints[i]
+                if c.type != "CHILD_OF":
+                    continue
+                target = c.target
+                if (
+                    target is not None
+                    and target.as_pointer() == armature_ptr
+                    and c.subtarget == bone_name
+                ):
+                    if kept is not None:
+                        constraints.remove(kept)
+                    kept = c
+                else:
+                    constraints.remove(c)
 
-            if not correct_constraint_found:
-                constraint = obj.constraints.new(type="CHILD_OF")
+            if kept is None:
+                constraint = constraints.new(type="CHILD_OF")
                 constraint.target = armature
                 constraint.subtarget = bone_name
             
@@ -162,21 +229,29 @@ def manual_constraint_parts(armature_name, bone_mesh_assignments):
     if not parts_collection:
         return False, "Could not find 'Parts' collection to execute on."
 
+    armature_ptr = armature.as_pointer()
+
     # Update constraints for all objects within this rig's parts collection
     for obj in parts_collection.objects:
         if obj.type != "MESH":
             continue
 
-        # First, remove any existing CHILD_OF constraint that targets this armature
-        # iterating over a copy of the list is crucial to safe removal
-        for c in list(obj.constraints):
-            if c.type == "CHILD_OF" and c.target == armature:
-                obj.constraints.remove(c)
+        # First, remove any existing CHILD_OF constraint that targets this armature.
+        # Walking backwards keeps removal safe without copying the list, and
+        # meshes with no constraints at all skip the scan entirely.
+        constraints = obj.constraints
+        for i in range(len(constraints) - 1, -1, -1):
+            c = constraints[i]
+            if c.type != "CHILD_OF":
+                continue
+            target = c.target
+            if target is not None and target.as_pointer() == armature_ptr:
+                constraints.remove(c)
 
         # Now, if this object is in our new assignment list, add the new constraint
-        if obj in bone_mesh_assignments:
-            bone_name = bone_mesh_assignments[obj]
-            constraint = obj.constraints.new(type="CHILD_OF")
+        bone_name = bone_mesh_assignments.get(obj)
+        if bone_name is not None:
+            constraint = constraints.new(type="CHILD_OF")
             constraint.target = armature
             constraint.subtarget = bone_name
 
@@ -2,6 +2,7 @@
 Rig creation and bone management utilities.
 """
 
+import functools
 import json
 import re
 import bpy
@@ -31,9 +32,23 @@ def _matrix_to_idprop(value):
     return value
 
 
+# Per-part matching trace (fingerprint hits/misses, authoritative bindings).
+# Off by default: it prints once per aux/primary part lookup.
+_DEBUG = False
+
+# Blender duplicate suffix (.001/.002 ...), compiled once for the match loops
+_SUFFIX_RE = re.compile(r"\.\d+$")
+
+# Roblox joint types rigged as locked weld bones rather than animated Motor6Ds
+_WELD_JOINT_TYPES = frozenset(("Weld", "WeldConstraint"))
+
+
+# Part and bone names repeat across the matching passes (index build,
+# fingerprint renames, per-aux lookups), so results are memoized
+@functools.lru_cache(maxsize=4096)
 def _strip_suffix(name: str) -> str:
     """Strip .001/.002 style suffixes for stable matching."""
-    return re.sub(r"\.\d+$", "", name or "")
+    return _SUFFIX_RE.sub("", name or "")
 
 
 def _get_mesh_world_center(obj):
@@ -45,15 +60,13 @@ def _get_mesh_world_center(obj):
     """
     if obj.type != "MESH" or not obj.data.vertices:
         return obj.matrix_world.to_translation()
-    from mathutils import Vector as _Vec
+    import numpy as np
     verts = obj.data.vertices
-    n = len(verts)
-    sx = sy = sz = 0.0
-    for v in verts:
-        sx += v.co.x
-        sy += v.co.y
-        sz += v.co.z
-    return obj.matrix_world @ _Vec((sx / n, sy / n, sz / n))
+    co = np.empty(len(verts) * 3, dtype=np.float32)
+    verts.foreach_get("co", co)
+    # accumulate in double precision like the scalar sum did
+    centroid = co.reshape(-1, 3).mean(axis=0, dtype=np.float64)
+    return obj.matrix_world @ Vector(centroid.tolist())
 
 
 def _mesh_center_in_t2b_space(obj):
@@ -2595,10 +2608,15 @@ def _apply_skinned_mesh_bindings(armature_obj, bindings):
     return applied
 
 
-def _fingerprint_position(matrix: Matrix, precision: int = 2) -> str:
-    """Create a position-only fingerprint for coarse matching."""
-    loc = matrix.to_translation()
-    return f"{round(loc.x, precision)},{round(loc.y, precision)},{round(loc.z, precision)}"
+def _fingerprint_point(loc: Vector, precision: int = 2) -> tuple:
+    """Create a position-only fingerprint for coarse matching.
+
+    The position quantized to 10**-precision units as an int tuple, which
+    hashes cheaper than a formatted string and puts -0.0 and 0.0 in the same
+    cell.
+    """
+    scale = 10 ** precision
+    return (round(loc.x * scale), round(loc.y * scale), round(loc.z * scale))
 
 
 def _build_match_context(parts_collection):
@@ -2617,15 +2635,19 @@ def _build_match_context(parts_collection):
             continue
         base = _strip_suffix(obj.name).lower()
         name_index.setdefault(base, []).append(obj)
+        mesh_centers[obj] = _mesh_center_in_t2b_space(obj)
 
-        center = _mesh_center_in_t2b_space(obj)
-        mesh_centers[obj] = center
+    if mesh_centers:
+        import numpy as np
 
-        # Build a fake 4x4 from the centroid so _fingerprint_position works
-        center_mat = Matrix.Translation(center)
-        for prec, idx in [(2, position_index_p2), (1, position_index_p1), (0, position_index_p0)]:
-            fp = _fingerprint_position(center_mat, prec)
-            idx.setdefault(fp, []).append(obj)
+        # quantize every centroid in one go; rint rounds half to even like
+        # round() in _fingerprint_point, so lookups land in the same cells.
+        # Each level rounds the raw centroid, never a finer cell.
+        centers = np.array([tuple(c) for c in mesh_centers.values()], dtype=np.float64)
+        for prec, idx in ((2, position_index_p2), (1, position_index_p1), (0, position_index_p0)):
+            cells = np.rint(centers * 10 ** prec).astype(np.int64).tolist()
+            for obj, cell in zip(mesh_centers, cells):
+                idx.setdefault(tuple(cell), []).append(obj)
 
     return {
         "name_index": name_index,
@@ -2664,6 +2686,22 @@ def _refresh_match_context(match_ctx):
     return refreshed
 
 
+def _fingerprint_base_index(match_ctx, fp_map):
+    """Group fingerprint map objects by suffix-stripped name, in map order.
+
+    Built once per fingerprint map and kept on match_ctx, so each lookup is a
+    dict hit instead of a scan over every mapped part.
+    """
+    cached = match_ctx.get("_fingerprint_base_index")
+    if cached is not None and cached[0] is fp_map and cached[1] == len(fp_map):
+        return cached[2]
+    index = {}
+    for obj_name, obj in fp_map.items():
+        index.setdefault(_strip_suffix(obj_name), []).append(obj)
+    match_ctx["_fingerprint_base_index"] = (fp_map, len(fp_map), index)
+    return index
+
+
 def _find_matching_part(aux_name, aux_cf, match_ctx):
     """Resolve an aux entry to a mesh.
     
@@ -2681,11 +2719,14 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
     if base_name in intentionally_missing_parts:
         return None
     
-    # Pre-compute expected position if we have transform data
+    # Pre-compute expected position if we have transform data; the position
+    # fingerprint fallback below reuses it. Only the translation of
+    # t2b @ cf_to_mat(aux_cf) is needed, which is t2b applied to the CFrame
+    # position, so no rotation matrix is built.
     expected_pos = None
     if aux_cf:
         try:
-            expected_pos = (t2b @ cf_to_mat(aux_cf)).to_translation()
+            expected_pos = t2b @ Vector((aux_cf[0], aux_cf[1], aux_cf[2]))
         except Exception:
             pass
 
@@ -2714,14 +2755,13 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
     fp_map = match_ctx.get("fingerprint_object_map", {})
     if aux_name and fp_map:
         # Collect ALL fp_map entries whose base name matches aux_name
-        fp_candidates = []
-        for obj_name, obj in fp_map.items():
-            if _strip_suffix(obj_name) == aux_name and obj not in used:
-                fp_candidates.append(obj)
+        fp_by_base = _fingerprint_base_index(match_ctx, fp_map)
+        fp_candidates = [obj for obj in fp_by_base.get(aux_name, ()) if obj not in used]
         
         if len(fp_candidates) == 1:
             obj = fp_candidates[0]
-            print(f"[_find_matching_part] FINGERPRINT HIT: '{aux_name}' -> mesh '{obj.name}'")
+            if _DEBUG:
+                print(f"[_find_matching_part] FINGERPRINT HIT: '{aux_name}' -> mesh '{obj.name}'")
             return obj
         elif len(fp_candidates) > 1:
             # Multiple candidates with same base name — use position to disambiguate
@@ -2733,19 +2773,20 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
                     return (c - expected_pos).length
                 fp_candidates.sort(key=_fp_dist)
                 obj = fp_candidates[0]
-                print(f"[_find_matching_part] FINGERPRINT HIT (pos disambig, {len(fp_candidates)} cands): '{aux_name}' -> mesh '{obj.name}' (dist={_fp_dist(obj):.4f})")
+                if _DEBUG:
+                    print(f"[_find_matching_part] FINGERPRINT HIT (pos disambig, {len(fp_candidates)} cands): '{aux_name}' -> mesh '{obj.name}' (dist={_fp_dist(obj):.4f})")
                 return obj
             else:
                 # No position data — try side check
                 side_ok = [o for o in fp_candidates if _side_ok(o)]
                 pool = side_ok if side_ok else fp_candidates
                 obj = pool[0]
-                print(f"[_find_matching_part] FINGERPRINT HIT (side disambig): '{aux_name}' -> mesh '{obj.name}'")
+                if _DEBUG:
+                    print(f"[_find_matching_part] FINGERPRINT HIT (side disambig): '{aux_name}' -> mesh '{obj.name}'")
                 return obj
-        else:
+        elif _DEBUG:
             # No candidates — check if they existed but were used
-            has_any = any(_strip_suffix(k) == aux_name for k in fp_map.keys())
-            if has_any:
+            if aux_name in fp_by_base:
                 print(f"[_find_matching_part] FINGERPRINT found but all used: '{aux_name}'")
             else:
                 print(f"[_find_matching_part] FINGERPRINT MISS: '{aux_name}' not in map (map has {len(fp_map)} entries)'")
@@ -2763,13 +2804,15 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
         if len(candidates) == 1:
             obj = candidates[0]
             if not _side_ok(obj):
-                print(f"[_find_matching_part] NAME MATCH '{aux_name}' -> '{obj.name}' BUT WRONG SIDE (using anyway, only candidate)")
+                if _DEBUG:
+                    print(f"[_find_matching_part] NAME MATCH '{aux_name}' -> '{obj.name}' BUT WRONG SIDE (using anyway, only candidate)")
             return obj
         # Multiple candidates — filter by side first, then distance
         side_ok_cands = [o for o in candidates if _side_ok(o)]
         pool = side_ok_cands if side_ok_cands else candidates
         if len(pool) == 1:
-            print(f"[_find_matching_part] NAME+SIDE: '{aux_name}' -> '{pool[0].name}' (1 on correct side of {len(candidates)})")
+            if _DEBUG:
+                print(f"[_find_matching_part] NAME+SIDE: '{aux_name}' -> '{pool[0].name}' (1 on correct side of {len(candidates)})")
             return pool[0]
         # Use vertex centroid distance to pick closest
         MAX_NAME_POS_DIST = 2.0  # generous — centroid may differ from CFrame origin
@@ -2783,27 +2826,28 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
             best_obj = pool[0]
             best_dist = _pos_dist(best_obj)
             if best_dist <= MAX_NAME_POS_DIST:
-                print(f"[_find_matching_part] NAME+SIDE+POS: '{aux_name}' -> '{best_obj.name}' (dist={best_dist:.4f}, {len(candidates)} candidates)")
+                if _DEBUG:
+                    print(f"[_find_matching_part] NAME+SIDE+POS: '{aux_name}' -> '{best_obj.name}' (dist={best_dist:.4f}, {len(candidates)} candidates)")
                 return best_obj
             else:
-                print(f"[_find_matching_part] NAME+SIDE+POS REJECTED: '{aux_name}' best '{best_obj.name}' too far ({best_dist:.4f})")
+                if _DEBUG:
+                    print(f"[_find_matching_part] NAME+SIDE+POS REJECTED: '{aux_name}' best '{best_obj.name}' too far ({best_dist:.4f})")
                 return None
         # No position data — take first from side-filtered pool
         if len(pool) <= 3:
             return pool[0]
-        print(f"[_find_matching_part] NAME AMBIGUOUS: '{aux_name}' has {len(pool)} candidates, no position data")
+        if _DEBUG:
+            print(f"[_find_matching_part] NAME AMBIGUOUS: '{aux_name}' has {len(pool)} candidates, no position data")
         return None
 
     # Position fingerprint fallback at multiple precision levels
     # Only accept unambiguous matches within a small distance threshold.
-    if aux_cf:
+    if expected_pos is not None:
         try:
-            expected_mat = t2b @ cf_to_mat(aux_cf)
-            expected_pos = expected_mat.to_translation()
-            max_dist = 0.05
+            max_dist_sq = 0.05 * 0.05
 
-            for prec in [2, 1, 0]:
-                fp = _fingerprint_position(expected_mat, prec)
+            for prec in (2, 1, 0):
+                fp = _fingerprint_point(expected_pos, prec)
                 idx = match_ctx.get(f"position_index_p{prec}", {})
                 candidates = [obj for obj in idx.get(fp, []) if obj not in used]
                 if len(candidates) != 1:
@@ -2813,9 +2857,10 @@ def _find_matching_part(aux_name, aux_cf, match_ctx):
                 actual_pos = mesh_centers.get(obj)
                 if actual_pos is None:
                     actual_pos = _mesh_center_in_t2b_space(obj)
-                if (actual_pos - expected_pos).length <= max_dist:
+                if (actual_pos - expected_pos).length_squared <= max_dist_sq:
                     if not _side_ok(obj):
-                        print(f"[_find_matching_part] POS FINGERPRINT '{aux_name}' -> '{obj.name}' WRONG SIDE, skipping")
+                        if _DEBUG:
+                            print(f"[_find_matching_part] POS FINGERPRINT '{aux_name}' -> '{obj.name}' WRONG SIDE, skipping")
                         continue
                     return obj
         except Exception:
@@ -2835,22 +2880,26 @@ def _apply_fingerprint_renames(rig_def, match_ctx, allow_aux_renames=True):
     name_index = match_ctx["name_index"]
     pending = []  # (obj, aux_name)
 
-    def walk(node):
-        aux_list = node.get("aux") or []
-        aux_tf = node.get("auxTransform") or []
-        for idx, aux_name in enumerate(aux_list):
-            if not aux_name:
-                continue
-            aux_cf = aux_tf[idx] if idx < len(aux_tf) else None
-            if not aux_cf:
-                continue
-            obj = _find_matching_part(aux_name, aux_cf, match_ctx)
-            if obj and _strip_suffix(obj.name) != aux_name:
-                pending.append((obj, aux_name))
-        for child in node.get("children", []):
-            walk(child)
-
-    walk(rig_def)
+    # Pre-order walk with an explicit stack (no recursion limit on deep
+    # rigs); children are pushed reversed so they are visited in order
+    stack = [rig_def]
+    while stack:
+        node = stack.pop()
+        aux_list = node.get("aux")
+        if aux_list:
+            aux_tf = node.get("auxTransform") or []
+            for idx, aux_name in enumerate(aux_list):
+                if not aux_name:
+                    continue
+                aux_cf = aux_tf[idx] if idx < len(aux_tf) else None
+                if not aux_cf:
+                    continue
+                obj = _find_matching_part(aux_name, aux_cf, match_ctx)
+                if obj and _strip_suffix(obj.name) != aux_name:
+                    pending.append((obj, aux_name))
+        children = node.get("children")
+        if children:
+            stack.extend(reversed(children))
     
     if pending:
         # Two-pass rename to avoid collisions
@@ -2897,7 +2946,7 @@ def _articulated_chain_children(rigsubdef):
     return [
         child
         for child in children
-        if (child.get("jointType") or "Motor6D") not in {"Weld", "WeldConstraint"}
+        if (child.get("jointType") or "Motor6D") not in _WELD_JOINT_TYPES
     ]
 
 
@@ -2910,8 +2959,11 @@ def load_rigbone(ao, rigging_type, rigsubdef, parent_bone, parts_collection, mat
 
     mat = cf_to_mat(rigsubdef["transform"])
     bone["transform"] = _matrix_to_idprop(mat)
-    t2b = get_transform_to_blender()
-    bone_dir = (t2b @ mat).to_3x3().to_4x4() @ Vector((0, 0, 1))
+    # t2b is built once per rig on the match context; the bone's world
+    # matrix is reused for every head/tail/direction below
+    t2b = match_ctx["t2b"]
+    world_mat = t2b @ mat
+    bone_dir = world_mat.to_3x3().to_4x4() @ Vector((0, 0, 1))
 
     # Check if this bone is marked as a deform bone from Studio export
     is_deform_bone = rigsubdef.get("isDeformBone", False)
@@ -2928,15 +2980,15 @@ def load_rigbone(ao, rigging_type, rigsubdef, parent_bone, parts_collection, mat
 
     if "jointtransform0" not in rigsubdef:
         # Rig root
-        bone.head = (t2b @ mat).to_translation()
-        bone.tail = (t2b @ mat) @ Vector((0, 0.01, 0))
+        bone.head = world_mat.to_translation()
+        bone.tail = world_mat @ Vector((0, 0.01, 0))
         bone["transform0"] = _matrix_to_idprop(Matrix())
         bone["transform1"] = _matrix_to_idprop(Matrix())
         bone["nicetransform"] = _matrix_to_idprop(Matrix())
         bone.align_roll(bone_dir)
         bone.hide_select = True
         pre_mat = bone.matrix
-        o_trans = t2b @ mat
+        o_trans = world_mat
     else:
         mat0 = cf_to_mat(rigsubdef["jointtransform0"])
         mat1 = cf_to_mat(rigsubdef["jointtransform1"])
@@ -2951,7 +3003,7 @@ def load_rigbone(ao, rigging_type, rigsubdef, parent_bone, parts_collection, mat
         bone.head = o_trans.to_translation()
         real_tail = o_trans @ Vector((0, 0.25, 0))
 
-        neutral_pos = (t2b @ mat).to_translation()
+        neutral_pos = world_mat.to_translation()
         bone.tail = real_tail
         bone.align_roll(bone_dir)
 
@@ -3077,9 +3129,19 @@ def _configure_weld_bones(armature_obj):
     
     settings = bpy.context.scene.rbx_anim_settings
     hide_welds = getattr(settings, "rbx_hide_weld_bones", False)
-    weld_shape = _get_or_create_weld_bone_shape()
+    # Bones without the property are Motor6D, which is not a weld type
+    weld_bones = [bone for bone in amt.bones if bone.get("rbx_joint_type") in _WELD_JOINT_TYPES]
+    # the shape curve is only created when some bone will use it
+    weld_shape = _get_or_create_weld_bone_shape() if weld_bones else None
     
-    _safe_mode_set("POSE", armature_obj)
+    # Pose bone display/lock settings and collection assignment are all plain
+    # data writes, so no POSE/OBJECT mode round trip is needed; only leave
+    # the armature active and selected as the mode switches used to
+    try:
+        bpy.context.view_layer.objects.active = armature_obj
+        armature_obj.select_set(True)
+    except Exception:
+        pass
     
     # Blender 4.0+ uses bone collections, 3.x uses bone.hide
     try:
@@ -3096,34 +3158,38 @@ def _configure_weld_bones(armature_obj):
         if weld_coll is None:
             weld_coll = collections.new(weld_coll_name)
     
-    for bone in amt.bones:
-        joint_type = bone.get("rbx_joint_type", "Motor6D")
-        if joint_type in ("Weld", "WeldConstraint"):
-            pose_bone = armature_obj.pose.bones.get(bone.name)
-            if pose_bone:
-                pose_bone.custom_shape = weld_shape
-                pose_bone.use_custom_shape_bone_size = True
-                
-                pose_bone.lock_location = (True, True, True)
-                pose_bone.lock_rotation = (True, True, True)
-                pose_bone.lock_rotation_w = True
-                pose_bone.lock_scale = (True, True, True)
-                
-                if hasattr(pose_bone, "color"):
-                    pose_bone.color.palette = 'CUSTOM'
-                    pose_bone.color.custom.normal = (0.3, 0.3, 0.3)
-                    pose_bone.color.custom.select = (0.5, 0.5, 0.5)
-                    pose_bone.color.custom.active = (0.6, 0.6, 0.6)
+    # resolved once per call rather than per bone
+    pose_bones = armature_obj.pose.bones
+    has_bone_color = "color" in bpy.types.PoseBone.bl_rna.properties
+    locked = (True, True, True)
+    
+    for bone in weld_bones:
+        pose_bone = pose_bones.get(bone.name)
+        if pose_bone:
+            pose_bone.custom_shape = weld_shape
+            pose_bone.use_custom_shape_bone_size = True
             
-            if use_collections:
-                weld_coll.assign(bone)
-            else:
-                bone.hide = hide_welds
+            pose_bone.lock_location = locked
+            pose_bone.lock_rotation = locked
+            pose_bone.lock_rotation_w = True
+            pose_bone.lock_scale = locked
+            
+            if has_bone_color:
+                pose_bone.color.palette = 'CUSTOM'
+                pose_bone.color.custom.normal = (0.3, 0.3, 0.3)
+                pose_bone.color.custom.select = (0.5, 0.5, 0.5)
+                pose_bone.color.custom.active = (0.6, 0.6, 0.6)
+        
+        if use_collections:
+            weld_coll.assign(bone)
+        else:
+            bone.hide = hide_welds
     
     if use_collections:
         weld_coll.is_visible = not hide_welds
     
-    _safe_mode_set("OBJECT", armature_obj)
+    if armature_obj.mode != "OBJECT":
+        _safe_mode_set("OBJECT", armature_obj)
 
 
 def create_rig(rigging_type, rig_meta_obj_name):
@@ -3192,7 +3258,8 @@ def create_rig(rigging_type, rig_meta_obj_name):
                 obj = parts_collection.objects.get(obj_name)
                 if obj:
                     fp_map[part_name] = obj
-                    print(f"[RigCreate]   '{part_name}' -> mesh '{obj.name}'")
+                    if _DEBUG:
+                        print(f"[RigCreate]   '{part_name}' -> mesh '{obj.name}'")
                 else:
                     print(f"[RigCreate]   WARNING: mesh '{obj_name}' not found for part '{part_name}'")
             print(f"[RigCreate] Loaded {len(fp_map)} authoritative fingerprint mappings")
@@ -3222,10 +3289,18 @@ def create_rig(rigging_type, rig_meta_obj_name):
     ao = bpy.context.object
     ao.show_in_front = True
 
-    # Move the new armature into the master collection
-    for coll in ao.users_collection:
-        coll.objects.unlink(ao)
-    master_collection.objects.link(ao)
+    # Move the new armature into the master collection. object.add links it
+    # into the active collection only; when that already is the master
+    # collection there is nothing to move. Snapshot before unlinking, since
+    # users_collection shrinks as we go.
+    in_master = False
+    for coll in tuple(ao.users_collection):
+        if coll == master_collection:
+            in_master = True
+        else:
+            coll.objects.unlink(ao)
+    if not in_master:
+        master_collection.objects.link(ao)
 
     # Set a unique name for the armature based on the rig name
     rig_name = meta_loaded.get("rigName", "Rig")
@@ -3274,24 +3349,47 @@ def create_rig(rigging_type, rig_meta_obj_name):
     pending = match_ctx.get("pending_constraints", [])
     print(f"[RigCreate] Applying {len(pending)} pending constraints...")
     
+    bones = ao.data.bones
+    resolved = []
     for obj, bone_name in pending:
-        bone = ao.data.bones.get(bone_name)
+        bone = bones.get(bone_name)
         if bone:
-            link_object_to_bone_rigid(obj, ao, bone)
-            authoritatively_constrained.add(obj)
-            print(f"[RigCreate] AUTHORITATIVE: mesh '{obj.name}' -> bone '{bone_name}'")
+            resolved.append((obj, bone))
         else:
             print(f"[RigCreate] WARNING: bone '{bone_name}' not found for mesh '{obj.name}'")
+
+    if resolved:
+        import numpy as np
+
+        # Child Of inverses for every pending part in one batched inversion
+        # instead of a Matrix.inverted() per constraint
+        bone_mats = np.array([np.array(bone.matrix_local) for _, bone in resolved], dtype=np.float64)
+        inverses = np.linalg.inv(np.array(ao.matrix_world, dtype=np.float64) @ bone_mats)
+        for (obj, bone), inverse in zip(resolved, inverses):
+            link_object_to_bone_rigid(obj, ao, bone, inverse_matrix=Matrix(inverse.tolist()))
+            authoritatively_constrained.add(obj)
+            if _DEBUG:
+                print(f"[RigCreate] AUTHORITATIVE: mesh '{obj.name}' -> bone '{bone.name}'")
     
     # Auto-constraint ONLY parts that were NOT authoritatively constrained
     # This handles any parts that weren't in the fingerprint map (legacy/fallback)
-    bpy.context.view_layer.update()
     skip_objects = set(authoritatively_constrained)
     skip_objects.update(skinned_mesh_bindings.keys())
     ok, msg = auto_constraint_parts(ao.name, skip_objects=skip_objects)
 
-    # If no parts matched via fallback, retry once (but STILL skip authoritative ones)
-    if ok and msg and "No matching parts found" in msg:
+    # If no parts matched via fallback, retry once (but STILL skip authoritative ones).
+    # Only worth a second pass when nothing was bound authoritatively and there
+    # are still unbound meshes for it to look at; otherwise it cannot match more.
+    if (
+        ok
+        and msg
+        and "No matching parts found" in msg
+        and not pending
+        and any(
+            obj.type == "MESH" and obj not in skip_objects
+            for obj in parts_collection.objects
+        )
+    ):
         # Capture the set in closure
         _skip_set = skip_objects
         _ao_name = ao.name
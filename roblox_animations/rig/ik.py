@@ -10,6 +10,11 @@ from mathutils import Vector, Matrix
 
 from ..core.utils import pose_bone_set_hidden
 
+# suffixes of the helper bones created by create_ik_config; test with
+# name.endswith(IK_HELPER_SUFFIXES) (a cached name set on the armature was
+# tried and dropped: it went stale when helpers were renamed or deleted)
+IK_HELPER_SUFFIXES = ("-IKTarget", "-IKPole", "-IKStretch")
+
 
 def has_ik_constraint(ao: "bpy.types.Object", pose_bone: "bpy.types.PoseBone") -> bool:
     """Check if the given pose bone has an IK constraint applied to it.
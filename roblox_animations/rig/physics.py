@@ -13,6 +13,7 @@ from mathutils import Vector
 from typing import Optional, Dict, List, Tuple
 
 from .com import calculate_com
+from .ik import IK_HELPER_SUFFIXES
 from ..core.utils import get_object_by_name
 
 
@@ -769,7 +770,7 @@ def _draw_ghost_armature(shader, ghost_bones: Dict[str, Tuple[Vector, Vector]]):
     
     for bone_name, (head, tail) in ghost_bones.items():
         # Skip IK helper bones
-        if any(s in bone_name for s in ["-IKTarget", "-IKPole", "-IKStretch"]):
+        if any(s in bone_name for s in IK_HELPER_SUFFIXES):
             continue
         
         vertices.extend([
@@ -0,0 +1,148 @@
+"""
+Helpers shared by the test modules and the in-Blender test runner.
+
+Nothing here imports bpy, so the runner logic can be tested on its own.
+"""
+
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+
+_SERIAL_ATTR = "__rbxanims_serial__"
+
+
+def serial(obj):
+    """Mark a TestCase class or test method as unsafe to run in parallel.
+
+    Anything touching bpy.data, scene state, or patching module globals must
+    be marked; it always runs on the calling thread after the parallel batch.
+    """
+    setattr(obj, _SERIAL_ATTR, True)
+    return obj
+
+
+def is_serial(test):
+    """True when *test* or its TestCase class was marked with @serial."""
+    if getattr(type(test), _SERIAL_ATTR, False):
+        return True
+    method = getattr(test, getattr(test, "_testMethodName", ""), None)
+    return getattr(method, _SERIAL_ATTR, False)
+
+
+def iter_tests(suite):
+    """Flatten nested TestSuites into individual tests."""
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from iter_tests(item)
+        else:
+            yield item
+
+
+class _CollectingResult(unittest.TestResult):
+    """Per-worker result; merged into one result on the calling thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.log.append(f"{test} ... ok")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.log.append(f"{test} ... FAIL")
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.log.append(f"{test} ... ERROR")
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self.log.append(f"{test} ... skipped {reason!r}")
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self.log.append(f"{test} ... expected failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self.log.append(f"{test} ... unexpected success")
+
+
+def _run_suite(tests):
+    # TestSuite.run drives setUpClass/tearDownClass around the tests
+    result = _CollectingResult()
+    unittest.TestSuite(tests).run(result)
+    return result
+
+
+def _merge(result, partial, stream):
+    result.testsRun += partial.testsRun
+    result.failures.extend(partial.failures)
+    result.errors.extend(partial.errors)
+    result.skipped.extend(partial.skipped)
+    result.expectedFailures.extend(partial.expectedFailures)
+    result.unexpectedSuccesses.extend(partial.unexpectedSuccesses)
+    for line in partial.log:
+        stream.write(line + "\n")
+
+
+def _write_summary(result, stream, elapsed):
+    """Error details and the closing summary, laid out like TextTestRunner."""
+    for flavour, errors in (("ERROR", result.errors), ("FAIL", result.failures)):
+        for test, err in errors:
+            stream.write("=" * 70 + "\n")
+            stream.write(f"{flavour}: {test}\n")
+            stream.write("-" * 70 + "\n")
+            stream.write(f"{err}\n")
+
+    run = result.testsRun
+    stream.write("-" * 70 + "\n")
+    stream.write(f"Ran {run} test{'' if run == 1 else 's'} in {elapsed:.3f}s\n\n")
+
+    infos = []
+    if result.failures:
+        infos.append(f"failures={len(result.failures)}")
+    if result.errors:
+        infos.append(f"errors={len(result.errors)}")
+    if result.skipped:
+        infos.append(f"skipped={len(result.skipped)}")
+    if result.expectedFailures:
+        infos.append(f"expected failures={len(result.expectedFailures)}")
+    if result.unexpectedSuccesses:
+        infos.append(f"unexpected successes={len(result.unexpectedSuccesses)}")
+    status = "OK" if result.wasSuccessful() else "FAILED"
+    stream.write(f"{status} ({', '.join(infos)})\n" if infos else f"{status}\n")
+
+
+def run_parallel(suite, stream, max_workers=None):
+    """Run thread-safe tests concurrently, then the @serial ones in order.
+
+    Unmarked tests are grouped by TestCase class and each class runs as one
+    unit on the pool, so setUpClass/tearDownClass still apply. Module-level
+    fixtures are not coordinated across workers.
+
+    Returns the merged unittest.TestResult.
+    """
+    groups = {}  # TestCase class -> its unmarked tests
+    sequential = []
+    for test in iter_tests(suite):
+        if is_serial(test):
+            sequential.append(test)
+        else:
+            groups.setdefault(type(test), []).append(test)
+
+    start = time.perf_counter()
+    result = _CollectingResult()
+    if groups:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as ex:
+            for partial in ex.map(_run_suite, groups.values()):
+                _merge(result, partial, stream)
+    if sequential:
+        _merge(result, _run_suite(sequential), stream)
+
+    _write_summary(result, stream, time.perf_counter() - start)
+    return result
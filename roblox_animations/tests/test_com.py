@@ -0,0 +1,74 @@
+import bpy
+import math
+import unittest
+
+from mathutils import Vector
+
+from .helpers import serial
+from ..core.utils import pose_bone_set_selected
+from ..rig.com import calculate_com, rotate_around_com
+
+
+def _cleanup():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for armature in list(bpy.data.armatures):
+        bpy.data.armatures.remove(armature)
+
+
+@serial
+class TestRotateAroundCom(unittest.TestCase):
+    """rotate_around_com turns the pose, not the object, about the COM."""
+
+    def setUp(self):
+        _cleanup()
+        # offset object so armature space and world space differ
+        bpy.ops.object.add(type="ARMATURE", enter_editmode=True, location=(5, 0, 0))
+        self.armature = bpy.context.object
+        edit_bones = self.armature.data.edit_bones
+        torso = edit_bones.new("LowerTorso")
+        torso.head = (0, 0, 0)
+        torso.tail = (0, 0, 1)
+        head = edit_bones.new("Head")
+        head.head = (0, 0, 2)
+        head.tail = (0, 0, 3)
+        head.parent = torso
+        bpy.ops.object.mode_set(mode="POSE")
+        for pose_bone in self.armature.pose.bones:
+            pose_bone_set_selected(pose_bone, False)
+
+    def tearDown(self):
+        if bpy.context.object and bpy.context.object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        _cleanup()
+
+    def _head_center(self):
+        pose_bone = self.armature.pose.bones["Head"]
+        return self.armature.matrix_world @ ((pose_bone.head + pose_bone.tail) * 0.5)
+
+    def test_positive_x_turns_up_into_minus_y(self):
+        com = calculate_com(self.armature)
+        offset = self._head_center() - com
+        self.assertGreater(offset.z, 0.1)
+        matrix_world = self.armature.matrix_world.copy()
+
+        rotate_around_com(self.armature, "X", math.radians(90))
+        bpy.context.view_layer.update()
+
+        # right-handed: +90 degrees about X takes +Z to -Y
+        expected = com + Vector((0, -offset.z, 0))
+        self.assertLess((self._head_center() - expected).length, 1e-4)
+        self.assertLess((calculate_com(self.armature) - com).length, 1e-4)
+        self.assertEqual(self.armature.matrix_world, matrix_world)
+
+    def test_only_topmost_selected_bones_rotate(self):
+        torso = self.armature.pose.bones["LowerTorso"]
+        head = self.armature.pose.bones["Head"]
+        pose_bone_set_selected(head, True)
+
+        rotate_around_com(self.armature, "Z", math.radians(45))
+        bpy.context.view_layer.update()
+
+        self.assertEqual(tuple(torso.rotation_quaternion), (1.0, 0.0, 0.0, 0.0))
+        self.assertEqual(tuple(torso.location), (0.0, 0.0, 0.0))
+        self.assertNotEqual(tuple(head.rotation_quaternion), (1.0, 0.0, 0.0, 0.0))
@@ -3,6 +3,7 @@ import struct
 import unittest
 from unittest import mock
 
+from .helpers import serial
 from ..animation.face_controls import (
     apply_facs_properties_to_armature,
     compute_facs_bone_transforms,
@@ -462,6 +463,7 @@ def _make_v7_mesh_with_lods():
     return b"version 7.00\n" + chunks
 
 
+@serial
 class TestFileMeshParsing(unittest.TestCase):
     def test_extract_asset_id(self):
         self.assertEqual(extract_asset_id("rbxassetid://12345"), 12345)
@@ -19,6 +19,7 @@ import importlib
 from unittest import mock
 from mathutils import Vector
 
+from .helpers import serial
 from ..operators import import_ops
 from ..rig import creation
 from ..rig import constraints
@@ -218,6 +219,7 @@ class TestWrapTransformComposition(unittest.TestCase):
         self.assertEqual(result, utils.cf_to_mat(origin))
 
 
+@serial
 class TestSkinnedMeshBindings(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -836,6 +838,7 @@ class TestDimsToRatios(unittest.TestCase):
         self.assertAlmostEqual(r1[1], r2[1], places=5)
 
 
+@serial
 class TestMatchContextRefresh(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -859,6 +862,7 @@ class TestMatchContextRefresh(unittest.TestCase):
         self.assertIs(_find_matching_part("LeftHand", None, match_ctx), obj)
 
 
+@serial
 class TestAuxRenameGuards(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -1105,6 +1109,7 @@ class TestWeaponMetadataHelpers(unittest.TestCase):
 # test: two-pass rename avoids blender auto-suffixing
 # ---------------------------------------------------------------------------
 
+@serial
 class TestTwoPassRename(unittest.TestCase):
     """Verify that the two-pass rename approach prevents blender from
     silently corrupting other objects' names via .001 suffixing."""
@@ -1147,6 +1152,7 @@ class TestTwoPassRename(unittest.TestCase):
 # test: _rename_parts_by_size_fingerprint
 # ---------------------------------------------------------------------------
 
+@serial
 class TestSizeFingerprintMatching(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -1211,6 +1217,17 @@ class TestSizeFingerprintMatching(unittest.TestCase):
         if right_obj:
             self.assertLess(right_obj.location.x, 0, "right hand mesh should be on -x side")
 
+    def test_coarse_position_cells_round_the_raw_centroid(self):
+        """0.149 rounds to the 0.1 cell, not via the 0.15 fine cell to 0.2;
+        0.497 rounds to the 0 cell, not via the 0.50 fine cell to 1."""
+        obj = _make_mesh_obj("edge", location=(0.149, 0.497, -0.149), collection=self.parts)
+        bpy.context.view_layer.update()
+        match_ctx = _build_match_context(self.parts)
+
+        self.assertEqual(match_ctx["position_index_p2"], {(15, 50, -15): [obj]})
+        self.assertEqual(match_ctx["position_index_p1"], {(1, 5, -1): [obj]})
+        self.assertEqual(match_ctx["position_index_p0"], {(0, 0, 0): [obj]})
+
     def test_tiny_meshes_discriminated(self):
         """Very small meshes with different aspect ratios should still be
         distinguished via RATIO_WEIGHT."""
@@ -1469,6 +1486,7 @@ class TestSizeFingerprintMatching(unittest.TestCase):
 # test: auto_constraint_parts (position-based disambiguation)
 # ---------------------------------------------------------------------------
 
+@serial
 class TestAutoConstraintParts(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -1568,6 +1586,7 @@ class TestAutoConstraintParts(unittest.TestCase):
 # test: _find_matching_part (creation.py)
 # ---------------------------------------------------------------------------
 
+@serial
 class TestFindMatchingPart(unittest.TestCase):
     def setUp(self):
         _cleanup()
@@ -1625,6 +1644,7 @@ class TestFindMatchingPart(unittest.TestCase):
 # test: end-to-end rename pipeline (fingerprint + position pass)
 # ---------------------------------------------------------------------------
 
+@serial
 class TestEndToEndRenamePipeline(unittest.TestCase):
     """Full pipeline test: _rename_parts_by_size_fingerprint followed by
     _rename_parts_by_fingerprint, simulating a real import."""
@@ -2,6 +2,7 @@ import bpy
 import unittest
 import mathutils
 import importlib
+from .helpers import serial
 from ..core import utils
 from ..operators import import_ops
 from ..server import requests
@@ -11,6 +12,7 @@ importlib.reload(utils)
 importlib.reload(import_ops)
 importlib.reload(requests)
 
+@serial
 class TestBoneMetadata(unittest.TestCase):
     def setUp(self):
         """Set up a clean scene before each test."""
@@ -0,0 +1,115 @@
+import io
+import threading
+import unittest
+
+from .helpers import is_serial, run_parallel, serial
+
+
+def _suite(*cases):
+    loader = unittest.TestLoader()
+    return unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in cases)
+
+
+class TestParallelRunner(unittest.TestCase):
+    def _run(self, *cases):
+        stream = io.StringIO()
+        result = run_parallel(_suite(*cases), stream, max_workers=4)
+        return result, stream.getvalue()
+
+    def test_serial_marks_classes_and_methods(self):
+        @serial
+        class Marked(unittest.TestCase):
+            def test_a(self):
+                pass
+
+        class PartlyMarked(unittest.TestCase):
+            @serial
+            def test_marked(self):
+                pass
+
+            def test_free(self):
+                pass
+
+        self.assertTrue(is_serial(Marked("test_a")))
+        self.assertTrue(is_serial(PartlyMarked("test_marked")))
+        self.assertFalse(is_serial(PartlyMarked("test_free")))
+
+    def test_merges_parallel_and_serial_results(self):
+        class Passing(unittest.TestCase):
+            def test_one(self):
+                pass
+
+            def test_two(self):
+                pass
+
+        class Broken(unittest.TestCase):
+            def test_fails(self):
+                self.fail("expected")
+
+            def test_errors(self):
+                raise RuntimeError("expected")
+
+            @unittest.skip("not here")
+            def test_skipped(self):
+                pass
+
+        @serial
+        class OnCaller(unittest.TestCase):
+            def test_serial(self):
+                pass
+
+        result, output = self._run(Passing, Broken, OnCaller)
+
+        self.assertEqual(result.testsRun, 6)
+        self.assertEqual(len(result.failures), 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(len(result.skipped), 1)
+        self.assertFalse(result.wasSuccessful())
+        self.assertIn("FAIL: test_fails", output)
+        self.assertIn("ERROR: test_errors", output)
+        self.assertIn("Ran 6 tests in ", output)
+        self.assertIn("FAILED (failures=1, errors=1, skipped=1)", output)
+
+    def test_class_fixtures_run_once_per_parallel_class(self):
+        events = []
+
+        class WithFixture(unittest.TestCase):
+            @classmethod
+            def setUpClass(cls):
+                events.append("setUpClass")
+
+            @classmethod
+            def tearDownClass(cls):
+                events.append("tearDownClass")
+
+            def test_a(self):
+                self.assertEqual(events[0], "setUpClass")
+
+            def test_b(self):
+                self.assertEqual(events[0], "setUpClass")
+
+        result, output = self._run(WithFixture)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(result.testsRun, 2)
+        self.assertEqual(events, ["setUpClass", "tearDownClass"])
+        self.assertTrue(output.rstrip().endswith("OK"))
+
+    def test_serial_tests_run_on_calling_thread(self):
+        threads = {}
+
+        class Free(unittest.TestCase):
+            def test_free(self):
+                threads["free"] = threading.current_thread()
+
+        @serial
+        class Pinned(unittest.TestCase):
+            def test_pinned(self):
+                threads["pinned"] = threading.current_thread()
+
+        caller = threading.current_thread()
+        result, _output = self._run(Free, Pinned)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertIs(threads["pinned"], caller)
+        self.assertIsNot(threads["free"], caller)
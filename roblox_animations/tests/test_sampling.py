@@ -0,0 +1,273 @@
+import bpy
+import math
+import unittest
+
+from mathutils import Euler, Matrix, Quaternion
+
+from .helpers import serial
+from ..animation.sampling import euler_to_matrices, quats_to_matrices, sample_pose_matrices
+from ..core.utils import get_action_fcurves
+from ..operators import validation_ops
+
+
+def _cleanup():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for armature in list(bpy.data.armatures):
+        bpy.data.armatures.remove(armature)
+    for action in list(bpy.data.actions):
+        bpy.data.actions.remove(action)
+
+
+def _build_keyed_rig():
+    """Root -> Arm -> Hand, keyed so Hand leaves the 5 stud bounds mid-range.
+
+    Arm is a quaternion bone, Hand an XYZ euler bone, so both rotation
+    conversions and the parent chain take part in the sampled pose.
+    """
+    bpy.ops.object.add(type="ARMATURE", enter_editmode=True, location=(0, 0, 0))
+    armature_obj = bpy.context.object
+    armature_obj.name = "SamplingRig"
+    edit_bones = armature_obj.data.edit_bones
+
+    root = edit_bones.new("Root")
+    root.head = (0, 0, 0)
+    root.tail = (0, 0.5, 0)
+    arm = edit_bones.new("Arm")
+    arm.head = (0, 0, 1)
+    arm.tail = (0, 0, 2)
+    arm.roll = 0.3
+    arm.parent = root
+    hand = edit_bones.new("Hand")
+    hand.head = (0, 0.2, 2.5)
+    hand.tail = (0, 0.2, 3)
+    hand.parent = arm
+
+    bpy.ops.object.mode_set(mode="POSE")
+    pose_bones = armature_obj.pose.bones
+    for name in ("Arm", "Hand"):
+        pose_bones[name].bone["is_transformable"] = True
+    pose_bones["Hand"].rotation_mode = "XYZ"
+
+    arm_pb = pose_bones["Arm"]
+    hand_pb = pose_bones["Hand"]
+    for frame, angle, offset in ((1, 0.0, 0.0), (5, 1.2, 0.5), (10, -2.0, 8.0)):
+        arm_pb.rotation_quaternion = Matrix.Rotation(angle, 4, "X").to_quaternion()
+        arm_pb.keyframe_insert(data_path="rotation_quaternion", frame=frame)
+        hand_pb.rotation_euler = (angle * 0.5, -angle, angle * 0.25)
+        hand_pb.keyframe_insert(data_path="rotation_euler", frame=frame)
+        hand_pb.location = (0, offset, 0)
+        hand_pb.keyframe_insert(data_path="location", frame=frame)
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    scene = bpy.context.scene
+    scene.frame_start = 1
+    scene.frame_end = 10
+    return armature_obj
+
+
+class TestRotationConversions(unittest.TestCase):
+    ANGLES = ((0.0, 0.0, 0.0), (0.3, -1.1, 2.0), (-2.9, 0.7, -0.2), (1.5, 1.5, -1.5))
+
+    def test_euler_matches_mathutils_for_every_order(self):
+        import numpy as np
+
+        eulers = np.array(self.ANGLES, dtype=np.float64)
+        for order in ("XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"):
+            mats = euler_to_matrices(eulers, order)
+            for angles, mat in zip(self.ANGLES, mats):
+                expected = np.array(Euler(angles, order).to_matrix())
+                np.testing.assert_allclose(mat, expected, atol=1e-6, err_msg=order)
+
+    def test_quaternion_matches_mathutils_and_normalizes(self):
+        import numpy as np
+
+        quats = [
+            (1.0, 0.0, 0.0, 0.0),
+            (0.5, 0.5, -0.5, 0.5),
+            (2.0, 0.4, -1.0, 0.3),  # not unit length; Blender normalizes
+            (-0.1, 0.9, 0.2, -0.4),
+        ]
+        mats = quats_to_matrices(np.array(quats, dtype=np.float64))
+        for quat, mat in zip(quats, mats):
+            expected = np.array(Quaternion(quat).normalized().to_matrix())
+            np.testing.assert_allclose(mat, expected, atol=1e-6)
+
+    def test_zero_quaternion_is_identity(self):
+        import numpy as np
+
+        mats = quats_to_matrices(np.zeros((1, 4)))
+        np.testing.assert_allclose(mats[0], np.eye(3))
+
+
+@serial
+class TestPoseSamplingMatchesFrameSet(unittest.TestCase):
+    """The FK pass must reproduce PoseBone.matrix along the parent chain."""
+
+    def setUp(self):
+        _cleanup()
+        self.armature = _build_keyed_rig()
+        self.action = self.armature.animation_data.action
+
+    def tearDown(self):
+        _cleanup()
+
+    def test_pose_matrices_match_evaluated_pose(self):
+        import numpy as np
+
+        frames = list(range(1, 11))
+        sampled = sample_pose_matrices(self.armature, self.action, frames)
+        self.assertIsNotNone(sampled)
+        pose_mats, quats = sampled
+        self.assertEqual(pose_mats.shape, (len(frames), 3, 4, 4))
+
+        scene = bpy.context.scene
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for fi, frame in enumerate(frames):
+            scene.frame_set(frame)
+            evaluated = self.armature.evaluated_get(depsgraph)
+            for bi, pose_bone in enumerate(evaluated.pose.bones):
+                np.testing.assert_allclose(
+                    pose_mats[fi, bi],
+                    np.array(pose_bone.matrix),
+                    atol=1e-4,
+                    err_msg=f"{pose_bone.name} @ {frame}",
+                )
+                np.testing.assert_allclose(
+                    quats[fi, bi], tuple(pose_bone.rotation_quaternion), atol=1e-5
+                )
+
+    def test_child_follows_parent_rotation(self):
+        import numpy as np
+
+        # with Hand's own channels gone and its pose reset, Hand is carried
+        # purely by Arm: parent pose @ rest offset, moving as Arm rotates
+        fcurves = get_action_fcurves(self.action)
+        for fcurve in [fc for fc in fcurves if 'pose.bones["Hand"]' in fc.data_path]:
+            fcurves.remove(fcurve)
+        hand_pb = self.armature.pose.bones["Hand"]
+        hand_pb.location = (0.0, 0.0, 0.0)
+        hand_pb.rotation_euler = (0.0, 0.0, 0.0)
+
+        pose_mats, _quats = sample_pose_matrices(self.armature, self.action, [1, 5])
+        names = [pb.name for pb in self.armature.pose.bones]
+        hand = names.index("Hand")
+        arm = names.index("Arm")
+        rest = np.array(self.armature.data.bones["Hand"].matrix_local)
+        arm_rest = np.array(self.armature.data.bones["Arm"].matrix_local)
+        expected = pose_mats[1, arm] @ np.linalg.inv(arm_rest) @ rest
+        np.testing.assert_allclose(pose_mats[1, hand], expected, atol=1e-6)
+        self.assertGreater(
+            np.linalg.norm(pose_mats[1, hand, :3, 3] - pose_mats[0, hand, :3, 3]), 0.1
+        )
+
+
+@serial
+class TestDirectSamplingGate(unittest.TestCase):
+    def setUp(self):
+        _cleanup()
+        self.armature = _build_keyed_rig()
+        self.action = self.armature.animation_data.action
+
+    def tearDown(self):
+        _cleanup()
+
+    def test_plain_keyed_rig_is_sampled_directly(self):
+        self.assertIsNotNone(sample_pose_matrices(self.armature, self.action, range(1, 11)))
+
+    def test_non_hold_extrapolation_needs_depsgraph(self):
+        self.armature.animation_data.action_extrapolation = "HOLD_FORWARD"
+        self.assertIsNone(sample_pose_matrices(self.armature, self.action, range(1, 11)))
+
+    def test_rest_position_needs_depsgraph(self):
+        self.armature.data.pose_position = "REST"
+        self.assertIsNone(sample_pose_matrices(self.armature, self.action, range(1, 11)))
+
+    def test_bone_constraint_needs_depsgraph(self):
+        self.armature.pose.bones["Hand"].constraints.new(type="COPY_ROTATION")
+        self.assertIsNone(sample_pose_matrices(self.armature, self.action, range(1, 11)))
+
+    def test_other_action_needs_depsgraph(self):
+        other = bpy.data.actions.new("Other")
+        self.assertIsNone(sample_pose_matrices(self.armature, other, range(1, 11)))
+
+    def test_extra_action_slot_needs_depsgraph(self):
+        if not hasattr(self.action, "slots"):
+            self.skipTest("layered actions need Blender 4.4+")
+        self.action.slots.new(id_type="OBJECT", name="Other")
+        self.assertIsNone(sample_pose_matrices(self.armature, self.action, range(1, 11)))
+
+
+@serial
+class TestValidationSamplingParity(unittest.TestCase):
+    """The action-sampled path must flag exactly what the frame_set path flags."""
+
+    def setUp(self):
+        _cleanup()
+        self.armature = _build_keyed_rig()
+        self.action = self.armature.animation_data.action
+
+    def tearDown(self):
+        _cleanup()
+
+    def _sample_both(self):
+        import numpy as np
+
+        armature = self.armature
+        scene = bpy.context.scene
+        bone_names = validation_ops._get_relevant_bone_names(armature, False)
+        root_name = validation_ops._get_root_bone_name(armature)
+        index = {pb.name: i for i, pb in enumerate(armature.pose.bones)}
+
+        direct = validation_ops._sample_action_frames(
+            armature, self.action, bone_names, root_name, 1, 10
+        )
+        self.assertIsNotNone(direct)
+        scene_heads, scene_roots, scene_rotation = validation_ops._sample_scene_frames(
+            scene,
+            bpy.context.evaluated_depsgraph_get(),
+            armature,
+            np.array([index[name] for name in bone_names], dtype=np.intp),
+            index[root_name],
+            1,
+            10,
+            True,
+        )
+        via_scene = (
+            np.stack(scene_heads),
+            np.array([tuple(r) for r in scene_roots]),
+            scene_rotation,
+        )
+        return bone_names, direct, via_scene
+
+    def test_bone_heads_match_frame_set(self):
+        import numpy as np
+
+        _names, (heads, roots, _quats, _qn), (scene_heads, scene_roots, _rot) = self._sample_both()
+        np.testing.assert_allclose(heads, scene_heads, atol=1e-4)
+        np.testing.assert_allclose(roots, scene_roots, atol=1e-4)
+
+    def test_bounds_violations_match_frame_set(self):
+        names, (heads, roots, _quats, _qn), (scene_heads, scene_roots, _rot) = self._sample_both()
+        direct = validation_ops._validate_bounds(heads, roots, 1.0, names, 1)
+        via_scene = validation_ops._validate_bounds(scene_heads, scene_roots, 1.0, names, 1)
+        self.assertTrue(direct, "rig is keyed to leave the bounds")
+        self.assertEqual([v[:2] for v in direct], [v[:2] for v in via_scene])
+
+    def test_rotation_warnings_match_frame_set(self):
+        _names, (_heads, _roots, quats, quat_names), (_sh, _sr, scene_rotation) = self._sample_both()
+        direct = [validation_ops._rotation_warnings(q, quat_names) for q in quats]
+        self.assertEqual(direct, scene_rotation)
+
+    def test_rotation_warnings_flag_the_same_bad_key(self):
+        fcurve = next(
+            fc for fc in get_action_fcurves(self.action)
+            if fc.data_path.endswith("rotation_quaternion") and fc.array_index == 0
+        )
+        fcurve.keyframe_points[1].co.y = math.inf
+        fcurve.update()
+
+        _names, (_heads, _roots, quats, quat_names), (_sh, _sr, scene_rotation) = self._sample_both()
+        direct = [validation_ops._rotation_warnings(q, quat_names) for q in quats]
+        self.assertTrue(any(direct), "the infinite key must be reported")
+        self.assertEqual(direct, scene_rotation)
@@ -6,6 +6,7 @@ import time  # Add time module for benchmarking
 import importlib
 
 # Import the specific modules we need for testing using relative imports
+from .helpers import serial
 from ..animation import serialization
 from ..animation import easing
 from ..core import utils
@@ -24,6 +25,7 @@ importlib.reload(easing)
 importlib.reload(serialization)
 
 
+@serial
 class TestAnimationSerialization(unittest.TestCase):
     def setUp(self):
         """Set up a clean scene before each test."""
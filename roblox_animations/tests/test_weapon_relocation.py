@@ -3,6 +3,7 @@ import math
 import importlib
 from mathutils import Matrix
 
+from .helpers import serial
 from ..core import utils, constants
 
 importlib.reload(utils)
@@ -315,6 +316,7 @@ def _relocated_bone_cf(bone_cf, relocation_mat):
     return mat_to_cf(new_mat)
 
 
+@serial
 class TestMeshRelocation(unittest.TestCase):
     """Verify that mesh matrix_world relocation (via the t2b conjugation)
     produces the same blender-space positions as the bone transforms relocated
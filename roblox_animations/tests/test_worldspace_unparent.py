@@ -5,6 +5,7 @@ import math
 import json
 import importlib
 
+from .helpers import serial
 from ..operators import rig_ops
 from ..core import utils
 from ..core.utils import (
@@ -29,6 +30,7 @@ importlib.reload(utils)
 importlib.reload(rig_ops)
 
 
+@serial
 class TestWorldSpaceUnparent(unittest.TestCase):
     """Tests for the world-space unparent/reparent system."""
 
@@ -434,6 +434,9 @@ class OBJECT_PT_RbxAnimations(bpy.types.Panel):
         row = validation_box.row(align=True)
         if settings:
             row.prop(settings, "rbx_max_studs_per_frame", text="Max studs/frame")
+            row = validation_box.row(align=True)
+            row.prop(settings, "rbx_validate_bounds_per_frame")
+            row.prop(settings, "rbx_validate_rotations_per_frame")
         row = validation_box.row(align=True)
         row.operator(
             "object.rbxanims_validate_motionpaths",
@@ -190,6 +190,18 @@ class RobloxAnimationSettings(PropertyGroup):
         min=0.0,
     )
 
+    rbx_validate_bounds_per_frame: BoolProperty(
+        name="Check bounds",
+        description="check every frame that bones stay within the max distance from the root",
+        default=True,
+    )
+
+    rbx_validate_rotations_per_frame: BoolProperty(
+        name="Check rotations",
+        description="check every frame for invalid (NaN/Inf) or extreme bone rotations",
+        default=True,
+    )
+
     rbx_show_motionpath_validation: BoolProperty(
         name="Show validation overlay",
         description="toggle drawing of violation overlays in 3d view",